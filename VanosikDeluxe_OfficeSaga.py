@@ -23,8 +23,10 @@ Vanosik vs Pizdyuk — Office Saga (Deluxe Roguelike)
 
 # Импортируем pygame и стандартные модули
 import pygame
-import sys, random, math, os, wave, struct, time, json, datetime
+import numpy as np
+import sys, random, math, os, time, json, datetime
 from dataclasses import dataclass, field, asdict
+from functools import lru_cache
 from pygame import Vector2
 
 # ====== GAME SETTINGS ======
@@ -93,48 +95,35 @@ def load_fonts():
 
 # ====== SOUND GENERATION ======
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-SND_DIR = os.path.join(BASE_DIR, "snd"); os.makedirs(SND_DIR, exist_ok=True)
 
-def gen_tone_wav(path, freq=440, ms=80, volume=0.5, fade_ms=8, sample_rate=44100):
-    if os.path.exists(path): return path
+def make_sound(pcm):
+    """Моно int16 PCM -> Sound в формате микшера, без WAV-файлов на диске."""
+    channels = pygame.mixer.get_init()[2]
+    if channels > 1:
+        pcm = np.repeat(pcm[:, None], channels, axis=1)
+    return pygame.sndarray.make_sound(np.ascontiguousarray(pcm))
+
+def gen_tone_sound(freq=440, ms=80, volume=0.5, fade_ms=8):
+    sample_rate = pygame.mixer.get_init()[0]
     frames = int(sample_rate * ms / 1000.0)
     fade = int(sample_rate * fade_ms / 1000.0)
-    with wave.open(path, "w") as wf:
-        wf.setnchannels(1)
-        wf.setsampwidth(2)
-        wf.setframerate(sample_rate)
-        for i in range(frames):
-            amp = volume
-            if i < fade: amp *= i / max(1, fade)
-            if i > frames - fade: amp *= (frames - i) / max(1, fade)
-            val = int(amp * 32767.0 * math.sin(2 * math.pi * freq * (i / sample_rate)))
-            wf.writeframesraw(struct.pack("<h", val))
-    return path
-
-def gen_cry_wav(path):
-    if os.path.exists(path): return path
-    sample_rate = 44100
+    i = np.arange(frames)
+    env = np.where(i < fade, i / max(1, fade), 1.0)
+    env *= np.where(i > frames - fade, (frames - i) / max(1, fade), 1.0)
+    pcm = (volume * env * 32767.0 * np.sin(2 * np.pi * freq * (i / sample_rate))).astype(np.int16)
+    return make_sound(pcm)
+
+def gen_cry_sound():
+    sample_rate = pygame.mixer.get_init()[0]
     total_ms = 280
     f1, f2 = 520, 340
     frames = int(sample_rate * total_ms / 1000.0)
-    with wave.open(path, "w") as wf:
-        wf.setnchannels(1); wf.setsampwidth(2); wf.setframerate(sample_rate)
-        for i in range(frames):
-            t = i / sample_rate
-            s = 0.5*math.sin(2*math.pi*f1*t) + 0.5*math.sin(2*math.pi*f2*t + 0.6*math.sin(30*t))
-            env = 1.0
-            if i < 400: env *= i/400
-            if i > frames-800: env *= (frames - i)/800
-            val = int(0.65 * env * 32767.0 * s)
-            wf.writeframesraw(struct.pack("<h", val))
-    return path
-
-HIT_WAV  = gen_tone_wav(os.path.join(SND_DIR, "hit.wav"),   freq=220, ms=90,  volume=0.7)
-STEP_WAV = gen_tone_wav(os.path.join(SND_DIR, "step.wav"),  freq=420, ms=40,  volume=0.3)
-WIN_WAV  = gen_tone_wav(os.path.join(SND_DIR, "win.wav"),   freq=720, ms=180, volume=0.6)
-LOSE_WAV = gen_tone_wav(os.path.join(SND_DIR, "lose.wav"),  freq=180, ms=220, volume=0.6)
-LEVEL_WAV= gen_tone_wav(os.path.join(SND_DIR, "lvl.wav"),   freq=520, ms=140, volume=0.6)
-CRY_WAV  = gen_cry_wav(os.path.join(SND_DIR, "cry.wav"))
+    i = np.arange(frames)
+    t = i / sample_rate
+    s = 0.5*np.sin(2*np.pi*f1*t) + 0.5*np.sin(2*np.pi*f2*t + 0.6*np.sin(30*t))
+    env = np.where(i < 400, i/400, 1.0) * np.where(i > frames-800, (frames - i)/800, 1.0)
+    pcm = (0.65 * env * 32767.0 * s).astype(np.int16)
+    return make_sound(pcm)
 
 # ====== PYGAME INIT ======
 try:
@@ -155,12 +144,12 @@ except Exception:
     pass
 
 try:
-    snd_hit  = pygame.mixer.Sound(HIT_WAV)
-    snd_step = pygame.mixer.Sound(STEP_WAV)
-    snd_win  = pygame.mixer.Sound(WIN_WAV)
-    snd_lose = pygame.mixer.Sound(LOSE_WAV)
-    snd_lvl  = pygame.mixer.Sound(LEVEL_WAV)
-    snd_cry  = pygame.mixer.Sound(CRY_WAV)
+    snd_hit  = gen_tone_sound(freq=220, ms=90,  volume=0.7)
+    snd_step = gen_tone_sound(freq=420, ms=40,  volume=0.3)
+    snd_win  = gen_tone_sound(freq=720, ms=180, volume=0.6)
+    snd_lose = gen_tone_sound(freq=180, ms=220, volume=0.6)
+    snd_lvl  = gen_tone_sound(freq=520, ms=140, volume=0.6)
+    snd_cry  = gen_cry_sound()
     snd_step.set_volume(0.35)
 except Exception:
     snd_hit = snd_step = snd_win = snd_lose = snd_lvl = snd_cry = None
@@ -168,36 +157,82 @@ except Exception:
 font_small, font_mid, font_big, font_huge = load_fonts()
 
 # ====== UTIL VISUALS ======
+def _gradient_rows(h, top_color, bottom_color):
+    t = np.linspace(0.0, 1.0, h)[:, None]
+    return (np.array(top_color[:3]) * (1 - t) + np.array(bottom_color[:3]) * t).astype(np.uint8)
+
 def draw_vertical_gradient(surface, top_color, bottom_color):
-    h = surface.get_height()
-    for y in range(h):
-        t = y / (h-1)
-        r = int(top_color[0]*(1-t) + bottom_color[0]*t)
-        g = int(top_color[1]*(1-t) + bottom_color[1]*t)
-        b = int(top_color[2]*(1-t) + bottom_color[2]*t)
-        pygame.draw.line(surface, (r,g,b), (0,y), (surface.get_width(), y))
+    w, h = surface.get_size()
+    rgb = _gradient_rows(h, top_color, bottom_color)
+    pygame.surfarray.blit_array(surface, np.broadcast_to(rgb[None, :, :], (w, h, 3)))
+    if surface.get_flags() & pygame.SRCALPHA:
+        # как и прежний draw.line с RGB-цветом — пиксели непрозрачные
+        alpha = pygame.surfarray.pixels_alpha(surface)
+        alpha[:] = 255
+        del alpha
+
+@lru_cache(maxsize=32)
+def get_gradient_surface(w, h, top_color, bottom_color):
+    """Готовый градиентный фон: строится один раз и дальше только блитится."""
+    rgb = _gradient_rows(h, top_color, bottom_color)
+    arr = np.broadcast_to(rgb[None, :, :], (w, h, 3))
+    return pygame.surfarray.make_surface(arr).convert()
+
+@lru_cache(maxsize=64)
+def _glow_cache(radius, color):
+    """Радиальное свечение одним спрайтом (альфа спадает квадратично к краю)."""
+    size = radius * 2
+    s = pygame.Surface((size, size), pygame.SRCALPHA)
+    s.fill((color[0], color[1], color[2], 0))
+    axis = np.arange(size) - radius + 0.5
+    d = np.hypot(axis[:, None], axis[None, :])
+    alpha = pygame.surfarray.pixels_alpha(s)
+    alpha[:] = (color[3] * np.clip(1 - d / radius, 0, 1) ** 2).astype(np.uint8)
+    del alpha
+    return s.convert_alpha()
 
 def draw_glow(surface, pos, radius, color=(255,140,80,120)):
     x, y = pos
-    layers = 8
-    for i in range(layers, 0, -1):
-        a = int(color[3] * (i/layers)**2)
-        r = int(radius * (i/layers))
-        s = pygame.Surface((r*2, r*2), pygame.SRCALPHA)
-        pygame.draw.circle(s, (color[0], color[1], color[2], a), (r, r), r)
-        surface.blit(s, (x-r, y-r), special_flags=pygame.BLEND_PREMULTIPLIED)
+    r = max(1, int(radius))
+    surface.blit(_glow_cache(r, tuple(color)), (x-r, y-r), special_flags=pygame.BLEND_PREMULTIPLIED)
 
-def draw_rounded_rect(surface, rect, color, radius=10):
-    pygame.draw.rect(surface, color, rect, border_radius=radius)
+@lru_cache(maxsize=32)
+def rounded_rect_surface(w, h, color, radius=10):
+    """Скруглённый прямоугольник рисуется один раз, дальше только блитится."""
+    s = pygame.Surface((w, h), pygame.SRCALPHA)
+    pygame.draw.rect(s, color, (0, 0, w, h), border_radius=radius)
+    return s.convert_alpha()
 
+def draw_rounded_rect(surface, rect, color, radius=10):
+    r = pygame.Rect(rect)
+    if r.w > 0 and r.h > 0:
+        surface.blit(rounded_rect_surface(r.w, r.h, color, radius), r)
+
+def draw_bar(surface, rect, ratio, color, bg=(20,22,36), radius=6):
+    """Полоса-индикатор: фон целиком, заливка — левая часть готового прямоугольника."""
+    x, y, w, h = rect
+    surface.blit(rounded_rect_surface(w, h, bg, radius), (x, y))
+    fill = int(w * max(0.0, min(1.0, ratio)))
+    if fill > 0:
+        surface.blit(rounded_rect_surface(w, h, color, radius), (x, y), (0, 0, fill, h))
+
+@lru_cache(maxsize=512)
+def render_text(text, font, color):
+    """font.render с кэшем: одинаковые строки рендерятся один раз."""
+    return font.render(text, True, color).convert_alpha()
+
+@lru_cache(maxsize=512)
 def text_with_outline(text, font, main=(255,255,255), outline=(0,0,0), shift=1):
+    """Текст с обводкой. Результат кэшируется — повторные строки не перерисовываются."""
     base = font.render(text, True, main)
     w, h = base.get_width()+shift*2, base.get_height()+shift*2
+    edge = font.render(text, True, outline)
     surf = pygame.Surface((w, h), pygame.SRCALPHA)
-    for dx,dy in ((-shift,0),(shift,0),(0,-shift),(0,shift),(-shift,-shift),(shift,shift),(-shift,shift),(shift,-shift)):
-        surf.blit(font.render(text, True, outline), (dx+shift, dy+shift))
+    surf.blits([(edge, (dx+shift, dy+shift)) for dx,dy in
+                ((-shift,0),(shift,0),(0,-shift),(0,shift),(-shift,-shift),(shift,shift),(-shift,shift),(shift,-shift))],
+               doreturn=False)
     surf.blit(base, (shift, shift))
-    return surf
+    return surf.convert_alpha()
 
 
 def wrap_text(text, font, max_width):
@@ -218,61 +253,110 @@ def wrap_text(text, font, max_width):
         lines.append(current)
     return lines
 
-# ====== PARTICLES ======
-class Particle:
-    def __init__(self, pos, vel, life, size, color):
-        self.x, self.y = pos
-        self.vx, self.vy = vel
-        self.life = life
-        self.life_max = life
-        self.size = size
-        self.color = color
 
-    def update(self, dt):
-        self.x += self.vx * dt
-        self.y += self.vy * dt
-        self.vy += 300 * dt  # gravity
-        self.life -= dt
-        return self.life > 0
+class SpatialHash:
+    """Равномерная сетка для быстрых запросов «что пересекает этот прямоугольник»."""
+    def __init__(self, cell=64):
+        self.cell = cell
+        self.cells = {}
 
-    def render(self, surface):
-        t = max(0.0, min(1.0, self.life/self.life_max))
-        a = int(220 * t)
-        s = max(1, int(self.size * (0.6 + 0.4*t)))
-        c = (*self.color[:3], a)
-        temp = pygame.Surface((s*2, s*2), pygame.SRCALPHA)
-        pygame.draw.circle(temp, c, (s, s), s)
-        surface.blit(temp, (int(self.x)-s, int(self.y)-s), special_flags=pygame.BLEND_PREMULTIPLIED)
+    def _keys(self, rect):
+        c = self.cell
+        for cx in range(rect.left // c, (rect.right - 1) // c + 1):
+            for cy in range(rect.top // c, (rect.bottom - 1) // c + 1):
+                yield cx, cy
+
+    def insert(self, obj, rect):
+        for key in self._keys(rect):
+            self.cells.setdefault(key, []).append(obj)
+
+    def query(self, rect):
+        """Объекты, чей rect пересекается с rect (каждый один раз)."""
+        found = []
+        for key in self._keys(rect):
+            for obj in self.cells.get(key, ()):
+                if obj not in found and rect.colliderect(obj.rect):
+                    found.append(obj)
+        return found
+
+# ====== PARTICLES ======
+PARTICLE_ALPHA_STEPS = 8
+MAX_PARTICLES = 2048
+
+@lru_cache(maxsize=256)
+def _particle_sprite(color, size, alpha_step):
+    """Кружок частицы заданного размера и ступени прозрачности."""
+    a = int(220 * alpha_step / PARTICLE_ALPHA_STEPS)
+    temp = pygame.Surface((size*2, size*2), pygame.SRCALPHA)
+    pygame.draw.circle(temp, (*color[:3], a), (size, size), size)
+    return temp.convert_alpha()
 
 class ParticleSystem:
+    """Частицы в виде параллельных numpy-массивов (SoA): физика — пара векторных операций.
+
+    Массивы выделены один раз на MAX_PARTICLES слотов; новые частицы пишутся по кольцу
+    поверх самых старых, живые помечены маской alive.
+    """
     def __init__(self):
-        self.items = []
+        n = MAX_PARTICLES
+        self.pos = np.zeros((n, 2), np.float32)
+        self.vel = np.zeros((n, 2), np.float32)
+        self.life = np.zeros(n, np.float32)
+        self.life_max = np.ones(n, np.float32)
+        self.size = np.zeros(n, np.uint8)
+        self.color = np.zeros((n, 3), np.uint8)
+        self.alive = np.zeros(n, bool)
+        self.head = 0
+
+    def __len__(self):
+        return int(np.count_nonzero(self.alive))
+
+    def _spawn(self, pos, ang, spd, life, size, color):
+        idx = (self.head + np.arange(len(ang))) % MAX_PARTICLES
+        self.head = int(idx[-1] + 1) % MAX_PARTICLES
+        self.pos[idx] = pos
+        self.vel[idx, 0] = np.cos(ang) * spd
+        self.vel[idx, 1] = np.sin(ang) * spd
+        self.life[idx] = life
+        self.life_max[idx] = life
+        self.size[idx] = size
+        self.color[idx] = color[:3]
+        self.alive[idx] = True
 
     def spawn_hit(self, pos, base_color=(255,180,60)):
-        for _ in range(12):
-            ang = random.random()*math.tau
-            spd = random.uniform(120, 280)
-            vx, vy = math.cos(ang)*spd, math.sin(ang)*spd
-            life = random.uniform(0.25, 0.5)
-            size = random.randint(2, 4)
-            c = (base_color[0], base_color[1], base_color[2])
-            self.items.append(Particle(pos, (vx,vy), life, size, c))
+        n = 12
+        self._spawn(pos, np.random.random(n) * math.tau, np.random.uniform(120, 280, n),
+                    np.random.uniform(0.25, 0.5, n), np.random.randint(2, 5, n), base_color)
 
     def spawn_ult_ring(self, pos, color=(255,120,60)):
-        for _ in range(36):
-            ang = (_/36.0)*math.tau
-            spd = random.uniform(260, 380)
-            vx, vy = math.cos(ang)*spd, math.sin(ang)*spd
-            life = random.uniform(0.35, 0.6)
-            size = random.randint(2, 3)
-            self.items.append(Particle(pos, (vx,vy), life, size, color))
+        n = 36
+        self._spawn(pos, np.arange(n) / n * math.tau, np.random.uniform(260, 380, n),
+                    np.random.uniform(0.35, 0.6, n), np.random.randint(2, 4, n), color)
 
     def update(self, dt):
-        self.items = [p for p in self.items if p.update(dt)]
+        self.pos += self.vel * dt
+        self.vel[:, 1] += 300 * dt  # gravity
+        self.life -= dt
+        self.alive &= self.life > 0
 
     def render(self, surface):
-        for p in self.items:
-            p.render(surface)
+        idx = np.flatnonzero(self.alive)
+        if not len(idx):
+            return
+        t = np.clip(self.life[idx] / self.life_max[idx], 0.0, 1.0)
+        s = np.maximum(1, (self.size[idx] * (0.6 + 0.4 * t)).astype(np.int32))
+        step = np.maximum(1, np.rint(t * PARTICLE_ALPHA_STEPS).astype(np.int32))
+        xy = self.pos[idx].astype(np.int32) - s[:, None]
+        # частицы, целиком ушедшие за экран, в blits не попадают
+        sw, sh = surface.get_size()
+        vis = (xy[:, 0] > -2 * s) & (xy[:, 1] > -2 * s) & (xy[:, 0] < sw) & (xy[:, 1] < sh)
+        if not vis.all():
+            idx, s, step, xy = idx[vis], s[vis], step[vis], xy[vis]
+        flags = pygame.BLEND_PREMULTIPLIED
+        # один вызов blits на все частицы вместо поштучных blit
+        surface.blits([(_particle_sprite(tuple(c), r, st), p, None, flags)
+                       for c, r, st, p in zip(self.color[idx].tolist(), s.tolist(), step.tolist(), xy.tolist())],
+                      doreturn=False)
 
 # ====== SIMPLE RPG SYSTEMS ======
 # Эти классы минимально расширяют оригинальную игру, добавляя
@@ -450,6 +534,15 @@ def calc_damage(attacker, defender):
     return max(1, int(base + variance - reduction))
 
 
+def knockback(src, dst, magnitude):
+    """Отброс от точки src к dst длиной magnitude — (kx, ky) на голых float."""
+    dx, dy = dst[0] - src[0], dst[1] - src[1]
+    if not (dx or dy):
+        return magnitude, 0.0
+    inv = magnitude / math.hypot(dx, dy)
+    return dx * inv, dy * inv
+
+
 @dataclass
 class Skill:
     name: str
@@ -515,16 +608,30 @@ class NPC:
         self.quest_desc = quest_desc
         self.reward = reward
         self.talked = False
+        # два готовых спрайта: с «!» над головой и без
+        mark = render_text("!", font_small, (255, 255, 255))
+        bounds = self.rect.union(mark.get_rect(topleft=(self.rect.x + 12, self.rect.y - 18)))
+        self._sprites = []
+        for with_mark in (False, True):
+            img = pygame.Surface(bounds.size, pygame.SRCALPHA)
+            r = self.rect.move(-bounds.x, -bounds.y)
+            body = pygame.Rect(r.x, r.y + 12, r.w, r.h - 12)
+            pygame.draw.rect(img, (200, 170, 110), body, border_radius=6)
+            head_center = (r.centerx, r.y + 12)
+            pygame.draw.circle(img, (240, 220, 170), head_center, 12)
+            pygame.draw.circle(img, (0, 0, 0), (head_center[0] - 4, head_center[1] - 3), 2)
+            pygame.draw.circle(img, (0, 0, 0), (head_center[0] + 4, head_center[1] - 3), 2)
+            if with_mark:
+                img.blit(mark, (r.x + 12, r.y - 18))
+            self._sprites.append(img.convert_alpha())
+        self.image_pos = bounds.topleft
+
+    @property
+    def image(self):
+        return self._sprites[not self.talked]
 
     def draw(self, surf):
-        body = pygame.Rect(self.rect.x, self.rect.y + 12, self.rect.w, self.rect.h - 12)
-        pygame.draw.rect(surf, (200, 170, 110), body, border_radius=6)
-        head_center = (self.rect.centerx, self.rect.y + 12)
-        pygame.draw.circle(surf, (240, 220, 170), head_center, 12)
-        pygame.draw.circle(surf, (0, 0, 0), (head_center[0] - 4, head_center[1] - 3), 2)
-        pygame.draw.circle(surf, (0, 0, 0), (head_center[0] + 4, head_center[1] - 3), 2)
-        if not self.talked:
-            surf.blit(font_small.render("!", True, (255, 255, 255)), (self.rect.x + 12, self.rect.y - 18))
+        surf.blit(self.image, self.image_pos)
 
 # ====== SAVE / LOAD ======
 SAVE_PATH = os.path.join(BASE_DIR, "save.json")
@@ -549,7 +656,7 @@ def save_game(game):
         "notes": game.notes_log,
     }
     with open(SAVE_PATH, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+        json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
 
 
 def load_game(game):
@@ -586,9 +693,12 @@ def load_game(game):
 
 class MainMenu:
     """Простейшее главное меню."""
+    BG = (20, 22, 30)
+
     def __init__(self):
         self.options = ["Играть", "Выход"]
         self.idx = 0
+        self.shown_idx = None  # какой пункт подсвечен на экране сейчас
 
     def update(self, events):
         for e in events:
@@ -601,26 +711,63 @@ class MainMenu:
                     return self.options[self.idx]
         return None
 
+    def _draw_option(self, surf, i):
+        col = (255,255,255) if i == self.idx else (150,150,150)
+        r = text_with_outline(self.options[i], font_big, col, (0,0,0))
+        rect = r.get_rect(topleft=(WIDTH//2 - r.get_width()//2, 260 + i*60))
+        surf.fill(self.BG, rect)
+        surf.blit(r, rect)
+        return rect
+
     def draw(self, surf):
-        surf.fill((20, 22, 30))
-        title = text_with_outline("Vanosik Office Saga", font_huge, (240,240,255), (0,0,0))
-        surf.blit(title, (WIDTH//2 - title.get_width()//2, 120))
-        for i, opt in enumerate(self.options):
-            col = (255,255,255) if i == self.idx else (150,150,150)
-            r = text_with_outline(opt, font_big, col, (0,0,0))
-            surf.blit(r, (WIDTH//2 - r.get_width()//2, 260 + i*60))
+        """Рисует меню. Возвращает None, если нужен полный flip,
+        иначе список изменившихся прямоугольников для display.update."""
+        if self.shown_idx is None:
+            surf.fill(self.BG)
+            title = text_with_outline("Vanosik Office Saga", font_huge, (240,240,255), (0,0,0))
+            surf.blit(title, (WIDTH//2 - title.get_width()//2, 120))
+            for i in range(len(self.options)):
+                self._draw_option(surf, i)
+            self.shown_idx = self.idx
+            return None
+        if self.shown_idx == self.idx:
+            return []
+        dirty = [self._draw_option(surf, self.shown_idx), self._draw_option(surf, self.idx)]
+        self.shown_idx = self.idx
+        return dirty
 
 # ====== CHARACTERS (Deluxe visuals) ======
+# Кадры анимации общие для всех экземпляров:
+# (класс, цвета, босс?) -> (атлас, {(состояние, отражён?): [Rect кадра в атласе]})
+_FRAME_CACHE: dict[tuple, tuple[pygame.Surface, dict[tuple, list]]] = {}
+
+def _build_atlas(images):
+    """Складывает все кадры (и их зеркальные копии) в одну поверхность в ряд."""
+    cells = [(st, flip, pygame.transform.flip(f, True, False) if flip else f)
+             for st, frames in images.items() for flip in (False, True) for f in frames]
+    atlas = pygame.Surface((sum(f.get_width() for *_, f in cells),
+                            max(f.get_height() for *_, f in cells)), pygame.SRCALPHA)
+    rects = {(st, flip): [] for st in images for flip in (False, True)}
+    x = 0
+    for st, flip, f in cells:
+        # MAX по пустому атласу — точная копия пикселей вместе с альфой
+        rects[(st, flip)].append(atlas.blit(f, (x, 0), special_flags=pygame.BLEND_RGBA_MAX))
+        x += f.get_width()
+    return atlas.convert_alpha(), rects
+
 class Vanosik(pygame.sprite.Sprite):
+    SIZE = (58, 74)
+
     def __init__(self, pos, stats: Stats | None = None):
         super().__init__()
-        self.w, self.h = 58, 74
-        self.images = self._build_anim_surfaces(VANOSIK_CLR)
+        self.w, self.h = self.SIZE
+        self.atlas, self.frame_rects = self._get_frames(VANOSIK_CLR)
         self.state = "idle"
         self.anim_t = 0.0
         self.anim_idx = 0
-        self.image = self.images[self.state][self.anim_idx]
-        self.rect = self.image.get_rect(center=pos)
+        self.frame_rect = self.frame_rects[(self.state, False)][self.anim_idx]
+        self.rect = pygame.Rect((0, 0), self.frame_rect.size)
+        self.rect.center = pos
         self.base_speed = 270.0
         self.speed = self.base_speed
         self.dir = pygame.Vector2(1, 0)
@@ -668,14 +815,16 @@ class Vanosik(pygame.sprite.Sprite):
         extra = weapon.upgrade_level * 2 if weapon else 0
         return base + extra + 2 * self.damage_bonus + self.inventory.bonus_damage()
 
-    def _char_surface(self, body_color, shadow=True, punch=False, phase=0.0):
-        surf = pygame.Surface((self.w, self.h), pygame.SRCALPHA)
+    @classmethod
+    def _char_surface(cls, body_color, shadow=True, punch=False, phase=0.0):
+        w, h = cls.SIZE
+        surf = pygame.Surface((w, h), pygame.SRCALPHA)
         if shadow:
-            sh = pygame.Surface((self.w, 20), pygame.SRCALPHA)
-            pygame.draw.ellipse(sh, (0,0,0,80), (8,0,self.w-16,14))
-            surf.blit(sh, (0, self.h-18), special_flags=pygame.BLEND_PREMULTIPLIED)
+            sh = pygame.Surface((w, 20), pygame.SRCALPHA)
+            pygame.draw.ellipse(sh, (0,0,0,80), (8,0,w-16,14))
+            surf.blit(sh, (0, h-18), special_flags=pygame.BLEND_PREMULTIPLIED)
         outline = (20,30,60)
-        cx = self.w//2
+        cx = w//2
         leg_off = int(math.sin(phase)*6)
         pygame.draw.rect(surf, outline, (cx-14, 42+leg_off, 12, 18), border_radius=6)
         pygame.draw.rect(surf, outline, (cx+2,  42-leg_off, 12, 18), border_radius=6)
@@ -698,54 +847,62 @@ class Vanosik(pygame.sprite.Sprite):
             for dx in (-16, 14):
                 pygame.draw.rect(surf, outline, (cx+dx, 24 + (arm_off if dx<0 else -arm_off), 10, 16), border_radius=6)
                 pygame.draw.rect(surf, body_color, (cx+dx+1, 25 + (arm_off if dx<0 else -arm_off), 8, 14), border_radius=6)
-        return surf
+        return surf.convert_alpha()
 
-    def _build_anim_surfaces(self, base_color):
+    @classmethod
+    def _build_anim_surfaces(cls, base_color):
         path = os.path.join(BASE_DIR, "assets", "vanosik.png")
         if os.path.exists(path):
             img = pygame.image.load(path).convert_alpha()
             return {"idle": [img], "walk": [img], "attack": [img]}
-        idle = [ self._char_surface(base_color, punch=False, phase=0.0),
-                 self._char_surface(base_color, punch=False, phase=1.1) ]
-        walk = [ self._char_surface(base_color, punch=False, phase=p) for p in (0.0,0.9,1.8,2.7) ]
-        attack = [ self._char_surface(base_color, punch=True,  phase=0.0),
-                   self._char_surface(base_color, punch=True,  phase=0.6) ]
+        idle = [ cls._char_surface(base_color, punch=False, phase=0.0),
+                 cls._char_surface(base_color, punch=False, phase=1.1) ]
+        walk = [ cls._char_surface(base_color, punch=False, phase=p) for p in (0.0,0.9,1.8,2.7) ]
+        attack = [ cls._char_surface(base_color, punch=True,  phase=0.0),
+                   cls._char_surface(base_color, punch=True,  phase=0.6) ]
         return {"idle": idle, "walk": walk, "attack": attack}
 
+    @classmethod
+    def _get_frames(cls, base_color):
+        key = (cls, base_color)
+        if key not in _FRAME_CACHE:
+            _FRAME_CACHE[key] = _build_atlas(cls._build_anim_surfaces(base_color))
+        return _FRAME_CACHE[key]
+
     def _set_state(self, st):
         if st != self.state:
             self.state = st; self.anim_idx = 0; self.anim_t = 0.0
-            frames = self.images[self.state]
-            self.image = frames[0] if frames else self.image
+            frames = self.frame_rects[(self.state, False)]
+            self.frame_rect = frames[0] if frames else self.frame_rect
+
+    def draw(self, surf):
+        return surf.blit(self.atlas, self.rect, self.frame_rect)
 
 
     def update(self, dt, keys):
         if self.ult_cd > 0: self.ult_cd = max(0.0, self.ult_cd - dt)
         self.recompute_stats()
-        vel = pygame.Vector2(0, 0)
-        if keys[pygame.K_w]: vel.y -= 1
-        if keys[pygame.K_s]: vel.y += 1
-        if keys[pygame.K_a]: vel.x -= 1
-        if keys[pygame.K_d]: vel.x += 1
-        if vel.length_squared() > 0:
-            vel = vel.normalize() * self.speed
-            self.dir = (vel.normalize() if vel.length() else pygame.Vector2(1, 0))
+        # клавиши читаются один раз в скаляры, без промежуточных Vector2
+        mx = keys[pygame.K_d] - keys[pygame.K_a]
+        my = keys[pygame.K_s] - keys[pygame.K_w]
+        if mx or my:
+            inv = 1.0 / math.hypot(mx, my)
+            self.dir.update(mx * inv, my * inv)
+            step = self.speed * dt
+            self.rect.x += int(self.dir.x * step); self.rect.y += int(self.dir.y * step)
             if self.state != "attack": self._set_state("walk")
         else:
             if self.state != "attack": self._set_state("idle")
-        self.rect.x += int(vel.x * dt); self.rect.y += int(vel.y * dt)
         self.rect.x = max(0, min(WIDTH - self.rect.w, self.rect.x))
         self.rect.y = max(80, min(HEIGHT - self.rect.h, self.rect.y))
 
         self.anim_t += dt
         frame_rate = 0.12 if self.state == "walk" else (0.08 if self.state == "attack" else 0.4)
-        frames = self.images[self.state]
+        frames = self.frame_rects[(self.state, self.dir.x < -0.2)]
         if frames:
             if self.anim_t >= frame_rate:
                 self.anim_t = 0.0; self.anim_idx = (self.anim_idx + 1) % len(frames)
-            img = frames[self.anim_idx]
-            if self.dir.x < -0.2: img = pygame.transform.flip(img, True, False)
-            self.image = img
+            self.frame_rect = frames[self.anim_idx]
 
         if self.attack_cooldown > 0: self.attack_cooldown = max(0.0, self.attack_cooldown - dt)
         if self.state == "walk" and snd_step:
@@ -805,16 +962,20 @@ class Vanosik(pygame.sprite.Sprite):
         return self.rage >= RAGE_MAX and self.ult_cd <= 0.0
 
 class Pizdyuk(pygame.sprite.Sprite):
+    SIZE = (50, 62)
+    BOSS_SIZE = (64, 80)
+
     def __init__(self, pos, boss=False):
         super().__init__()
         self.is_boss = boss
-        self.w, self.h = (64, 80) if boss else (50, 62)
+        self.w, self.h = self.BOSS_SIZE if boss else self.SIZE
         base = BOSS_COLOR if boss else PIZDYUK_CLR
-        self.images = self._build_anim_surfaces(base, (255,120,160) if boss else PIZDYUK_HIT_CLR)
+        self.atlas, self.frame_rects = self._get_frames(base, (255,120,160) if boss else PIZDYUK_HIT_CLR, boss)
         self.state = "run"
         self.anim_t = 0.0; self.anim_idx = 0
-        self.image = self.images[self.state][self.anim_idx]
-        self.rect = self.image.get_rect(center=pos)
+        self.frame_rect = self.frame_rects[(self.state, False)][self.anim_idx]
+        self.rect = pygame.Rect((0, 0), self.frame_rect.size)
+        self.rect.center = pos
         self.base_speed = 210.0 * (BOSS_SPD_MULT if boss else 1.0)
         self.speed = self.base_speed
         self.dir = pygame.Vector2(-1, 0)
@@ -835,15 +996,17 @@ class Pizdyuk(pygame.sprite.Sprite):
             self.weapons.append(Weapon("Лазерный указатель", "ranged", damage=10, range=200, ap_cost=2))
         self.weapon = random.choice(self.weapons)
 
-    def _char_surface(self, base, hitc, hurt=False, phase=0.0):
-        surf = pygame.Surface((self.w, self.h), pygame.SRCALPHA)
-        sh = pygame.Surface((self.w, 22), pygame.SRCALPHA)
-        pygame.draw.ellipse(sh, (0,0,0,80), (8,0,self.w-16,16))
-        surf.blit(sh, (0, self.h-20), special_flags=pygame.BLEND_PREMULTIPLIED)
-        outline = (35, 24, 48) if self.is_boss else (24, 20, 36)
+    @classmethod
+    def _char_surface(cls, base, hitc, is_boss, hurt=False, phase=0.0):
+        w, h = cls.BOSS_SIZE if is_boss else cls.SIZE
+        surf = pygame.Surface((w, h), pygame.SRCALPHA)
+        sh = pygame.Surface((w, 22), pygame.SRCALPHA)
+        pygame.draw.ellipse(sh, (0,0,0,80), (8,0,w-16,16))
+        surf.blit(sh, (0, h-20), special_flags=pygame.BLEND_PREMULTIPLIED)
+        outline = (35, 24, 48) if is_boss else (24, 20, 36)
         body = hitc if hurt else base
-        cx = self.w//2
-        leg_off = int(math.sin(phase) * (8 if self.is_boss else 6))
+        cx = w//2
+        leg_off = int(math.sin(phase) * (8 if is_boss else 6))
         pygame.draw.rect(surf, outline, (cx-10, 44+leg_off, 10, 16), border_radius=6)
         pygame.draw.rect(surf, outline, (cx+2,  44-leg_off, 10, 16), border_radius=6)
         pygame.draw.rect(surf, body, (cx-9, 45+leg_off, 8, 14), border_radius=6)
@@ -853,28 +1016,39 @@ class Pizdyuk(pygame.sprite.Sprite):
         shade = pygame.Surface((22,26), pygame.SRCALPHA)
         draw_vertical_gradient(shade, (255,255,255,80), (0,0,0,0))
         surf.blit(shade, (cx-11,19), special_flags=pygame.BLEND_PREMULTIPLIED)
-        pygame.draw.circle(surf, outline, (cx,12), 10 if self.is_boss else 9)
-        pygame.draw.circle(surf, body, (cx,12), 9 if self.is_boss else 8)
-        arm_off = int(math.cos(phase) * (6 if self.is_boss else 5))
+        pygame.draw.circle(surf, outline, (cx,12), 10 if is_boss else 9)
+        pygame.draw.circle(surf, body, (cx,12), 9 if is_boss else 8)
+        arm_off = int(math.cos(phase) * (6 if is_boss else 5))
         for dx in (-16, 14):
             pygame.draw.rect(surf, outline, (cx+dx, 22 + (arm_off if dx<0 else -arm_off), 10, 14), border_radius=6)
             pygame.draw.rect(surf, body, (cx+dx+1, 23 + (arm_off if dx<0 else -arm_off), 8, 12), border_radius=6)
-        return surf
+        return surf.convert_alpha()
 
-    def _build_anim_surfaces(self, base, hitc):
+    @classmethod
+    def _build_anim_surfaces(cls, base, hitc, is_boss):
         path = os.path.join(BASE_DIR, "assets", "pizdyuk.png")
         if os.path.exists(path):
             img = pygame.image.load(path).convert_alpha()
             return {"run": [img], "hit": [img]}
-        run = [ self._char_surface(base, hitc, hurt=False, phase=p) for p in (0.0,1.1,2.2,3.3) ]
-        hit = [ self._char_surface(base, hitc, hurt=True,  phase=p) for p in (0.0,1.2) ]
+        run = [ cls._char_surface(base, hitc, is_boss, hurt=False, phase=p) for p in (0.0,1.1,2.2,3.3) ]
+        hit = [ cls._char_surface(base, hitc, is_boss, hurt=True,  phase=p) for p in (0.0,1.2) ]
         return {"run": run, "hit": hit}
 
+    @classmethod
+    def _get_frames(cls, base, hitc, is_boss):
+        key = (cls, base, hitc, is_boss)
+        if key not in _FRAME_CACHE:
+            _FRAME_CACHE[key] = _build_atlas(cls._build_anim_surfaces(base, hitc, is_boss))
+        return _FRAME_CACHE[key]
+
     def _set_state(self, st):
         if st != self.state:
             self.state = st; self.anim_idx = 0; self.anim_t = 0.0
-            frames = self.images[self.state]
-            self.image = frames[0] if frames else self.image
+            frames = self.frame_rects[(self.state, False)]
+            self.frame_rect = frames[0] if frames else self.frame_rect
+
+    def draw(self, surf):
+        return surf.blit(self.atlas, self.rect, self.frame_rect)
 
     def select_weapon(self, dist: float):
         """Выбор оружия в зависимости от дистанции."""
@@ -891,36 +1065,41 @@ class Pizdyuk(pygame.sprite.Sprite):
         if self.state == "hit":
             self.hit_t -= dt
             if self.hit_t <= 0: self._set_state("run")
-        to_player = pygame.Vector2(player_rect.center) - pygame.Vector2(self.rect.center)
-        dist = to_player.length() + 1e-6
-        dir_to = to_player.normalize()
+        # скалярная математика вместо пачки временных Vector2 на каждый кадр
+        dx = player_rect.centerx - self.rect.centerx
+        dy = player_rect.centery - self.rect.centery
+        length = math.hypot(dx, dy)
+        dist = length + 1e-6
+        nx, ny = (dx / length, dy / length) if length else (0.0, 0.0)
         desired_min, desired_max = (140, 260) if not self.is_boss else (160, 300)
-        if dist < desired_min: base_vec = -dir_to
-        elif dist > desired_max: base_vec = dir_to * 0.6
-        else: base_vec = pygame.Vector2(0, 0)
-        tangent = pygame.Vector2(-dir_to.y, dir_to.x) * self.orbit_sign
-        jitter = pygame.Vector2(random.uniform(-0.3, 0.3), random.uniform(-0.3, 0.3))
-        charge = pygame.Vector2(0, 0)
+        if dist < desired_min: base = -1.0 * 1.4
+        elif dist > desired_max: base = 0.6 * 0.5
+        else: base = 0.0
+        sign = self.orbit_sign
+        jx = random.uniform(-0.3, 0.3); jy = random.uniform(-0.3, 0.3)
+        charge = 0.0
         if random.random() < (0.02 if not self.is_boss else 0.04):
-            charge = (dir_to if dist > desired_max else -dir_to) * (2.0 if not self.is_boss else 2.6)
-
-        w_base = 1.4 if dist < desired_min else (0.5 if dist > desired_max else 0.0)
-        self.dir = base_vec * w_base + tangent * 1.0 + jitter * 0.6 + charge * 1.4
-        if self.dir.length_squared() > 0: self.dir = self.dir.normalize()
-        vel = self.dir * self.speed
-        self.rect.x += int(vel.x * dt); self.rect.y += int(vel.y * dt)
+            charge = (1.0 if dist > desired_max else -1.0) * (2.0 if not self.is_boss else 2.6) * 1.4
+
+        k = base + charge
+        dir_x = nx * k - ny * sign + jx * 0.6
+        dir_y = ny * k + nx * sign + jy * 0.6
+        d2 = dir_x * dir_x + dir_y * dir_y
+        if d2 > 0:
+            inv = 1.0 / math.sqrt(d2)
+            dir_x *= inv; dir_y *= inv
+        self.dir.update(dir_x, dir_y)
+        self.rect.x += int(dir_x * self.speed * dt); self.rect.y += int(dir_y * self.speed * dt)
         self.rect.x = max(0, min(WIDTH - self.rect.w, self.rect.x))
         self.rect.y = max(80, min(HEIGHT - self.rect.h, self.rect.y))
 
         self.anim_t += dt
-        frames = self.images[self.state]
+        frames = self.frame_rects[(self.state, self.dir.x < -0.2)]
         if frames:
             frame_rate = 0.10 if self.state == "run" else 0.06
             if self.anim_t >= frame_rate:
                 self.anim_t = 0.0; self.anim_idx = (self.anim_idx + 1) % len(frames)
-            img = frames[self.anim_idx]
-            if self.dir.x < -0.2: img = pygame.transform.flip(img, True, False)
-            self.image = img
+            self.frame_rect = frames[self.anim_idx]
 
         if self.cry_timer > 0: self.cry_timer -= dt
         else:
@@ -932,10 +1111,10 @@ class Pizdyuk(pygame.sprite.Sprite):
                 else:
                     self.taunt_timer = random.uniform(1.2, 2.2)
 
-    def on_hit(self, knockback_vec):
+    def on_hit(self, kx, ky):
         self._set_state("hit"); self.hit_t = 0.25
-        kb = knockback_vec * (BOSS_KB_RESIST if self.is_boss else 1.0)
-        self.rect.x += int(kb.x); self.rect.y += int(kb.y)
+        resist = BOSS_KB_RESIST if self.is_boss else 1.0
+        self.rect.x += int(kx * resist); self.rect.y += int(ky * resist)
         self.rect.x = max(0, min(WIDTH - self.rect.w, self.rect.x))
         self.rect.y = max(80, min(HEIGHT - self.rect.h, self.rect.y))
         self.last_phrase = random.choice(["ААА! Больно!","Не бей!","Ай! За что?!"]); self.cry_timer = 0.6
@@ -991,11 +1170,18 @@ class Door:
         self.rect = pygame.Rect(rect)
         self.target = target_room
         self.label = label
+        # рамка и подпись двери статичны — собираем их в один спрайт
+        txt = text_with_outline(f"→ {self.target}", font_small, (230,230,240), (0,0,0))
+        w = max(self.rect.w, txt.get_width() + 6)
+        h = max(self.rect.h, txt.get_height() + 6)
+        self.image = pygame.Surface((w, h), pygame.SRCALPHA)
+        pygame.draw.rect(self.image, (180,180,220), (0, 0, self.rect.w, self.rect.h), 2)
+        self.image.blit(txt, (6, 6))
+        self.image = self.image.convert_alpha()
+        self.image_pos = self.rect.topleft
 
     def draw(self, surf):
-        pygame.draw.rect(surf, (180,180,220), self.rect, 2)
-        txt = text_with_outline(f"→ {self.target}", font_small, (230,230,240), (0,0,0))
-        surf.blit(txt, (self.rect.x+6, self.rect.y+6))
+        surf.blit(self.image, self.image_pos)
 
 class Note:
     def __init__(self, pos, text):
@@ -1003,15 +1189,23 @@ class Note:
         self.text = text
         self.rect = pygame.Rect(int(pos[0]-10), int(pos[1]-8), 20, 16)
         self.picked = False
+        icon = render_text("✉", font_small, (60,40,10))
+        bounds = self.rect.union(icon.get_rect(topleft=(self.rect.x+3, self.rect.y-2)))
+        self.image = pygame.Surface(bounds.size, pygame.SRCALPHA)
+        body = self.rect.move(-bounds.x, -bounds.y)
+        pygame.draw.rect(self.image, (250,240,180), body)
+        pygame.draw.rect(self.image, (80,60,20), body, 2)
+        self.image.blit(icon, (body.x+3, body.y-2))
+        self.image = self.image.convert_alpha()
+        self.image_pos = bounds.topleft
 
     def draw(self, surf):
         if self.picked: return
-        pygame.draw.rect(surf, (250,240,180), self.rect)
-        pygame.draw.rect(surf, (80,60,20), self.rect, 2)
-        surf.blit(font_small.render("✉", True, (60,40,10)), (self.rect.x+3, self.rect.y-2))
+        surf.blit(self.image, self.image_pos)
 
 class InteractiveObject:
-    """Базовый интерактивный объект комнаты."""
+    """Базовый интерактивный объект комнаты.
+    Наследник задаёт image и image_pos: комната рисует объекты одним blits."""
     def __init__(self, rect):
         self.rect = pygame.Rect(rect)
         self.used = False
@@ -1029,6 +1223,13 @@ class Desk(InteractiveObject):
     def __init__(self, pos):
         rect = pygame.Rect(int(pos[0]-30), int(pos[1]-20), 60, 40)
         super().__init__(rect)
+        self._sprites = []
+        for color in ((170,130,90), (110,90,70)):
+            img = pygame.Surface(self.rect.size).convert()
+            img.fill(color)
+            pygame.draw.rect(img, (40,20,10), img.get_rect(), 2)
+            self._sprites.append(img)
+        self.image_pos = self.rect.topleft
 
     def interact(self, game):
         if self.used:
@@ -1046,10 +1247,16 @@ class Desk(InteractiveObject):
                 game.toast_show("Ваносик пал!", 3.0)
                 game.reset(game.player.stats)
 
+    @property
+    def image(self):
+        return self._sprites[self.used]
+
     def draw(self, surf):
-        color = (170,130,90) if not self.used else (110,90,70)
-        pygame.draw.rect(surf, color, self.rect)
-        pygame.draw.rect(surf, (40,20,10), self.rect, 2)
+        surf.blit(self.image, self.image_pos)
+
+# Фон комнаты (картинка/заливка + шапка + сетка) не зависит от состояния —
+# собирается один раз на имя комнаты и переживает повторные заходы
+_ROOM_BG_CACHE: dict[str, pygame.Surface] = {}
 
 class RoomScene:
     def __init__(self, name):
@@ -1058,6 +1265,8 @@ class RoomScene:
         self.notes = []
         self.npcs = []
         self.objects = []
+        self.static_bg = None  # фон + сетка + двери, собирается при первой отрисовке
+        self.index = None      # SpatialHash по дверям/запискам/объектам/NPC
 
     def make_default_doors(self):
         neighbors = ROOMS[self.name]
@@ -1068,24 +1277,37 @@ class RoomScene:
         self.doors.clear()
         for i, nb in enumerate(neighbors[:4]):
             self.doors.append(Door(slots[i], nb, f"В {nb}"))
-
-    def draw_bg(self, surf):
+        self.static_bg = None
+        self.index = None
+
+    def add_note(self, note):
+        self.notes.append(note)
+        if self.index is not None:
+            self.index.insert(note, note.rect)
+
+    def nearby(self, rect):
+        """Интерактивные объекты комнаты, пересекающие rect."""
+        if self.index is None:
+            self.index = SpatialHash()
+            for obj in (*self.doors, *self.notes, *self.objects, *self.npcs):
+                self.index.insert(obj, obj.rect)
+        return self.index.query(rect)
+
+    def _build_room_bg(self):
+        bg = pygame.Surface((WIDTH, HEIGHT)).convert()
         path = os.path.join(BASE_DIR, "assets", "rooms", f"{self.name}.png")
         if os.path.exists(path):
             img = pygame.image.load(path).convert()
-            surf.blit(img, (0,0))
+            bg.blit(img, (0,0))
         else:
             base = ROOM_COLORS.get(self.name, (36,36,42))
-            surf.fill(base)
+            bg.fill(base)
         # header strip
-        pygame.draw.rect(surf, (0,0,0,120), (0,0,WIDTH,60))
+        pygame.draw.rect(bg, (0,0,0,120), (0,0,WIDTH,60))
         title = text_with_outline(self.name, font_big, (240,240,255), (0,0,0))
-        surf.blit(title, (24, 14))
-        hint = font_small.render("E — действие   TAB — журнал   SPACE — удар   SHIFT — ульта", True, (210,210,230))
-        surf.blit(hint, (24, 40))
-
-    def draw(self, surf):
-        self.draw_bg(surf)
+        bg.blit(title, (24, 14))
+        hint = render_text("E — действие   TAB — журнал   SPACE — удар   SHIFT — ульта", font_small, (210,210,230))
+        bg.blit(hint, (24, 40))
         # subtle grid like Deluxe
         grid = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
         step = 48
@@ -1095,70 +1317,105 @@ class RoomScene:
         for x in range(0, WIDTH, step):
             a = 28 if (x//step) % 2 == 0 else 16
             pygame.draw.line(grid, (255,255,255,a), (x,60), (x,HEIGHT))
-        surf.blit(grid, (0,0))
-        for d in self.doors:
-            d.draw(surf)
-        for n in self.notes:
-            n.draw(surf)
-        for obj in self.objects:
-            obj.draw(surf)
-        for npc in self.npcs:
-            npc.draw(surf)
+        bg.blit(grid, (0,0))
+        return bg
+
+    def draw_bg(self, surf):
+        bg = _ROOM_BG_CACHE.get(self.name)
+        if bg is None:
+            bg = _ROOM_BG_CACHE[self.name] = self._build_room_bg()
+        surf.blit(bg, (0,0))
+
+    def _build_static_bg(self):
+        bg = pygame.Surface((WIDTH, HEIGHT)).convert()
+        self.draw_bg(bg)
+        bg.blits([(d.image, d.image_pos) for d in self.doors], doreturn=False)
+        return bg
+
+    def draw(self, surf):
+        if self.static_bg is None:
+            self.static_bg = self._build_static_bg()
+        surf.blit(self.static_bg, (0,0))
+        # записки, объекты и NPC — готовые спрайты, отправляем их одним вызовом blits
+        sprites = [(n.image, n.image_pos) for n in self.notes if not n.picked]
+        sprites += [(o.image, o.image_pos) for o in (*self.objects, *self.npcs)]
+        surf.blits(sprites, doreturn=False)
 
 # ====== UI (HUD, карта, журнал) ======
-def hud_panel(surf, rect, alpha=140):
-    panel = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA)
+@lru_cache(maxsize=32)
+def _panel_surf(w, h, alpha):
+    """Полупрозрачная подложка панели — одна на размер и прозрачность."""
+    panel = pygame.Surface((w, h), pygame.SRCALPHA)
     panel.fill((0,0,0,alpha))
-    surf.blit(panel, rect)
+    return panel.convert_alpha()
+
+def hud_panel(surf, rect, alpha=140):
+    surf.blit(_panel_surf(rect.width, rect.height, alpha), rect)
+
+@lru_cache(maxsize=2)
+def _hp_bar_sprites(is_boss):
+    """Рамка и градиентная заливка полоски HP над врагом — строятся один раз."""
+    w, h = (120, 14) if is_boss else (70, 10)
+    frame = pygame.Surface((w+4, h+4), pygame.SRCALPHA)
+    pygame.draw.rect(frame, (255,255,255), (0,0,w+4,h+4), border_radius=8)
+    pygame.draw.rect(frame, (32,36,48), (2,2,w,h), border_radius=8)
+    grad = pygame.Surface((w, h), pygame.SRCALPHA)
+    rgb = _gradient_rows(h, HP_BG, HP_FG)
+    pygame.surfarray.blit_array(grad, np.broadcast_to(rgb[None, :, :], (w, h, 3)))
+    alpha = pygame.surfarray.pixels_alpha(grad)
+    alpha[:] = 220
+    del alpha
+    return frame.convert_alpha(), grad.convert_alpha()
 
 def draw_hp_bar_above(surface, sprite_rect, hp, hp_max, is_boss=False):
     ratio = max(0.0, min(1.0, hp / max(1, hp_max)))
-    w, h = (120, 14) if is_boss else (70, 10)
+    frame, grad = _hp_bar_sprites(is_boss)
+    w, h = grad.get_size()
     x = sprite_rect.centerx - w // 2
     y = sprite_rect.top - (22 if is_boss else 14)
-    pygame.draw.rect(surface, (255,255,255,30), (x-2,y-2,w+4,h+4), border_radius=8)
-    pygame.draw.rect(surface, (32,36,48), (x,y,w,h), border_radius=8)
-    grad = pygame.Surface((w, h), pygame.SRCALPHA)
-    for yy in range(h):
-        t = yy/max(1,h-1)
-        cr = int(HP_BG[0]*(1-t) + HP_FG[0]*t)
-        cg = int(HP_BG[1]*(1-t) + HP_FG[1]*t)
-        cb = int(HP_BG[2]*(1-t) + HP_FG[2]*t)
-        pygame.draw.line(grad, (cr,cg,cb,220), (0,yy), (int(w*ratio), yy))
-    surface.blit(grad, (x,y))
-
-def draw_minimap(surf, current_room, piz_room):
-    map_rect = pygame.Rect(WIDTH - 280, 12, 268, 220)
-    hud_panel(surf, map_rect)
-    surf.blit(font_small.render("Карта", True, (230, 230, 240)), (map_rect.x + 8, map_rect.y + 6))
-    rooms = list(ROOMS.keys())
-    cols = 3
-    spacing_x, spacing_y = 80, 60
-    size = 36
-    start_x, start_y = map_rect.x + 24, map_rect.y + 40
-    positions = {}
-    for idx, r in enumerate(rooms):
-        cx = idx % cols
-        cy = idx // cols
-        x = start_x + cx * spacing_x
-        y = start_y + cy * spacing_y
-        positions[r] = (x, y)
+    surface.blit(frame, (x-2, y-2))
+    surface.blit(grad, (x, y), (0, 0, int(w*ratio), h))
+
+MINIMAP_RECT = pygame.Rect(WIDTH - 280, 12, 268, 220)
+MINIMAP_CELL = 36
+# левый верхний угол клетки каждой комнаты в координатах панели карты
+MINIMAP_POS = {r: (24 + (i % 3) * 80, 40 + (i // 3) * 60) for i, r in enumerate(ROOMS)}
+
+def _draw_minimap_room(surf, r, col, ox=0, oy=0):
+    x, y = MINIMAP_POS[r]
+    rect = pygame.Rect(ox + x, oy + y, MINIMAP_CELL, MINIMAP_CELL)
+    pygame.draw.rect(surf, col, rect, border_radius=4)
+    pygame.draw.rect(surf, (230, 230, 240), rect, 2, border_radius=4)
+    num = render_text(str(list(ROOMS).index(r) + 1), font_small, (0, 0, 0))
+    surf.blit(num, (rect.x + rect.w // 2 - num.get_width() // 2, rect.y + rect.h // 2 - num.get_height() // 2))
+
+@lru_cache(maxsize=1)
+def _minimap_base():
+    """Неизменная часть карты: панель, заголовок, связи и все комнаты в сером.
+    Хранится с премультиплицированной альфой — полупрозрачная панель и
+    сглаженный текст на ней ложатся на экран так же, как при прямой отрисовке."""
+    # нижний ряд комнат выходит за панель — поверхность берётся с запасом
+    h = max(MINIMAP_RECT.h, max(y for _, y in MINIMAP_POS.values()) + MINIMAP_CELL)
+    base = pygame.Surface((MINIMAP_RECT.w, h), pygame.SRCALPHA)
+    base.fill((0, 0, 0, 140), ((0, 0), MINIMAP_RECT.size))
+    base.blit(render_text("Карта", font_small, (230, 230, 240)).premul_alpha(), (8, 6),
+              special_flags=pygame.BLEND_PREMULTIPLIED)
+    half = MINIMAP_CELL // 2
     for r, ns in ROOMS.items():
-        x, y = positions[r]
+        x, y = MINIMAP_POS[r]
         for nb in ns:
-            nx, ny = positions[nb]
-            pygame.draw.line(surf, (100, 100, 120), (x + size // 2, y + size // 2), (nx + size // 2, ny + size // 2), 2)
-    for r, (x, y) in positions.items():
-        rect = pygame.Rect(x, y, size, size)
-        col = (60, 60, 70)
-        if r == current_room:
-            col = (240, 240, 80)
-        elif r == piz_room:
-            col = (220, 90, 90)
-        pygame.draw.rect(surf, col, rect, border_radius=4)
-        pygame.draw.rect(surf, (230, 230, 240), rect, 2, border_radius=4)
-        num = font_small.render(str(rooms.index(r) + 1), True, (0, 0, 0))
-        surf.blit(num, (rect.x + rect.w // 2 - num.get_width() // 2, rect.y + rect.h // 2 - num.get_height() // 2))
+            nx, ny = MINIMAP_POS[nb]
+            pygame.draw.line(base, (100, 100, 120), (x + half, y + half), (nx + half, ny + half), 2)
+    for r in ROOMS:
+        _draw_minimap_room(base, r, (60, 60, 70))
+    return base.convert_alpha()
+
+def draw_minimap(surf, current_room, piz_room):
+    surf.blit(_minimap_base(), MINIMAP_RECT, special_flags=pygame.BLEND_PREMULTIPLIED)
+    # поверх готовой карты перекрашиваются только две клетки
+    if piz_room != current_room and piz_room in MINIMAP_POS:
+        _draw_minimap_room(surf, piz_room, (220, 90, 90), *MINIMAP_RECT.topleft)
+    _draw_minimap_room(surf, current_room, (240, 240, 80), *MINIMAP_RECT.topleft)
 
 def draw_notes_log(surf, notes_log):
     rect = pygame.Rect(WIDTH//2-360, 90, 720, HEIGHT-180)
@@ -1168,12 +1425,12 @@ def draw_notes_log(surf, notes_log):
     y = rect.y + 60
     line_h = font_small.get_height() + 6
     if not notes_log:
-        surf.blit(font_mid.render("Пока нет улик. Ищи записки ✉ в комнатах.", True, (220,220,230)), (rect.x+16, y))
+        surf.blit(render_text("Пока нет улик. Ищи записки ✉ в комнатах.", font_mid, (220,220,230)), (rect.x+16, y))
     else:
         for t in notes_log[-12:]:
             lines = wrap_text("• " + t, font_small, rect.width - 32)
             for line in lines:
-                txt = font_small.render(line, True, (230,230,240))
+                txt = render_text(line, font_small, (230,230,240))
                 surf.blit(txt, (rect.x+16, y))
                 y += line_h
 
@@ -1181,31 +1438,26 @@ def draw_hp_bar(surface, player):
     label = text_with_outline("HP", font_small, (245,240,255), (0,0,0))
     surface.blit(label, (16, HEIGHT - 108))
     bar_w, bar_h = 180, 12; x, y = 16, HEIGHT - 98
-    draw_rounded_rect(surface, (x,y,bar_w,bar_h), (20,22,36), 6)
-    ratio = player.hp / max(1, player.hp_max)
-    draw_rounded_rect(surface, (x,y,int(bar_w*ratio),bar_h), (80,220,110), 6)
+    draw_bar(surface, (x,y,bar_w,bar_h), player.hp / max(1, player.hp_max), (80,220,110))
 
 
 def draw_rage_bar(surface, player):
     label = text_with_outline("Rage", font_small, (245,240,255), (0,0,0))
     surface.blit(label, (16, HEIGHT - 74))
     bar_w, bar_h = 180, 12; x, y = 16, HEIGHT - 44
-    draw_rounded_rect(surface, (x,y,bar_w,bar_h), (20,22,36), 6)
-    w = int(bar_w * max(0, min(1, player.rage/RAGE_MAX)))
-    draw_rounded_rect(surface, (x,y,w,bar_h), (220,120,60), 6)
+    draw_bar(surface, (x,y,bar_w,bar_h), player.rage / RAGE_MAX, (220,120,60))
     if player.ult_cd > 0:
-        cd_txt = font_small.render(f"ULT КД: {player.ult_cd:.1f}s", True, UI_MUTE)
+        cd_txt = render_text(f"ULT КД: {player.ult_cd:.1f}s", font_small, UI_MUTE)
         surface.blit(cd_txt, (x + bar_w + 12, y - 2))
 
+SKILL_KEYS_HINT = render_text("1:Урон  2:Скорость  3:-КД  4:Дальность", font_small, UI_MUTE)
+
 def draw_xp_bar(surface, player):
     txt = text_with_outline(f"Лвл игрока: {player.level}  (SP: {player.skill_points})", font_small, (240,245,255), (0,0,0))
     surface.blit(txt, (WIDTH - txt.get_width() - 16, HEIGHT - 74))
     bar_w, bar_h = 220, 12; x, y = WIDTH - bar_w - 16, HEIGHT - 44
-    draw_rounded_rect(surface, (x,y,bar_w,bar_h), (20,22,36), 6)
-    ratio = player.xp / max(1, player.xp_next)
-    draw_rounded_rect(surface, (x,y,int(bar_w*ratio),bar_h), (120,160,240), 6)
-    hint = font_small.render("1:Урон  2:Скорость  3:-КД  4:Дальность", True, UI_MUTE)
-    surface.blit(hint, (x, y - 18))
+    draw_bar(surface, (x,y,bar_w,bar_h), player.xp / max(1, player.xp_next), (120,160,240))
+    surface.blit(SKILL_KEYS_HINT, (x, y - 18))
 
 
 def draw_inventory(surface, inv):
@@ -1215,23 +1467,23 @@ def draw_inventory(surface, inv):
     surface.blit(title, (rect.x+16, rect.y+12))
     y = rect.y + 60
     coins = inv.coin_count()
-    surface.blit(font_small.render(f"Монеты: {coins}", True, (230,230,240)), (rect.x+16, y))
+    surface.blit(render_text(f"Монеты: {coins}", font_small, (230,230,240)), (rect.x+16, y))
     y += 28
     weapon = inv.current_weapon()
     if weapon:
-        surface.blit(font_small.render(f"Оружие: {weapon.name} (ур.{weapon.upgrade_level})", True, (230,230,240)), (rect.x+16, y))
+        surface.blit(render_text(f"Оружие: {weapon.name} (ур.{weapon.upgrade_level})", font_small, (230,230,240)), (rect.x+16, y))
         y += 24
-        surface.blit(font_small.render(f"Урон {weapon.damage}  Дист {weapon.range}", True, (230,230,240)), (rect.x+16, y))
+        surface.blit(render_text(f"Урон {weapon.damage}  Дист {weapon.range}", font_small, (230,230,240)), (rect.x+16, y))
         y += 30
         cost = weapon.upgrade_cost_base * (weapon.upgrade_level + 1)
-        hint = font_small.render(f"[U] Улучшить за {cost} монет", True, UI_MUTE)
+        hint = render_text(f"[U] Улучшить за {cost} монет", font_small, UI_MUTE)
         surface.blit(hint, (rect.x+16, rect.y + rect.height - 40))
     if inv.items:
         y_items = rect.y + 60
         for it in inv.items:
             if it.name == "Монетка":
                 continue
-            surface.blit(font_small.render(f"{it.name}", True, (230,230,240)), (rect.x+220, y_items))
+            surface.blit(render_text(f"{it.name}", font_small, (230,230,240)), (rect.x+220, y_items))
             y_items += 24
 
 
@@ -1243,7 +1495,7 @@ def draw_skill_tree(surface, tree):
     y = rect.y + 60
     for i, (k, sk) in enumerate(tree.skills.items(), 1):
         status = "✓" if sk.unlocked else f"{i}"
-        txt = font_small.render(f"[{status}] {sk.name}", True, (230,230,240))
+        txt = render_text(f"[{status}] {sk.name}", font_small, (230,230,240))
         surface.blit(txt, (rect.x+16, y)); y += 26
 
 # ====== Story / Intro ======
@@ -1261,13 +1513,17 @@ INTRO_TEXT = [
 ]
 
 def show_intro():
-    tbg = pygame.Surface((WIDTH, HEIGHT)); draw_vertical_gradient(tbg, BG_TOP, BG_BOTTOM)
+    tbg = get_gradient_surface(WIDTH, HEIGHT, BG_TOP, BG_BOTTOM)
     vignette = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
     for r in range(10, max(WIDTH,HEIGHT)//2, 4):
         alpha = int(220 * (r/(max(WIDTH,HEIGHT)//2))**2)
         pygame.draw.circle(vignette, (0,0,0,alpha//10), (WIDTH//2, HEIGHT//2), r)
     idx = 0; wait = 0.0
     typing = ""
+    # неизменная часть кадра (фон, виньетка, заголовок, готовые строки, подсказка)
+    # пересобирается только когда дописана очередная строка
+    frame = pygame.Surface((WIDTH, HEIGHT)).convert()
+    frame_idx = -1
     last_time = time.perf_counter()
     while True:
         now = time.perf_counter(); dt = min(0.05, now - last_time); last_time = now
@@ -1276,9 +1532,6 @@ def show_intro():
             if e.type == pygame.KEYDOWN:
                 if e.key in (pygame.K_ESCAPE, pygame.K_RETURN, pygame.K_SPACE):
                     return
-        screen.blit(tbg, (0,0)); screen.blit(vignette, (0,0))
-        title = text_with_outline("Vanosik vs Pizduk — Office Saga", font_huge, (255,255,255), (0,0,0))
-        screen.blit(title, (WIDTH//2 - title.get_width()//2, 50))
 
         if idx < len(INTRO_TEXT):
             wait -= dt
@@ -1289,23 +1542,26 @@ def show_intro():
                     typing = full[:len(typing)+1]
                 else:
                     idx += 1; typing = ""; wait = 0.3
-        y = 170
-        for i in range(min(idx, len(INTRO_TEXT))):
-            s = text_with_outline(INTRO_TEXT[i], font_big, (240,240,255), (0,0,0))
-            screen.blit(s, (WIDTH//2 - s.get_width()//2, y)); y += 44
+        y = 170 + 44 * min(idx, len(INTRO_TEXT))
+        if frame_idx != idx:
+            frame_idx = idx
+            frame.blit(tbg, (0,0)); frame.blit(vignette, (0,0))
+            title = text_with_outline("Vanosik vs Pizduk — Office Saga", font_huge, (255,255,255), (0,0,0))
+            frame.blit(title, (WIDTH//2 - title.get_width()//2, 50))
+            for i in range(min(idx, len(INTRO_TEXT))):
+                s = text_with_outline(INTRO_TEXT[i], font_big, (240,240,255), (0,0,0))
+                frame.blit(s, (WIDTH//2 - s.get_width()//2, 170 + 44 * i))
+            tip = render_text("Нажми ENTER/SPACE — начать", font_small, (230,230,240))
+            frame.blit(tip, (WIDTH//2 - tip.get_width()//2, HEIGHT-40))
+        screen.blit(frame, (0,0))
         if idx < len(INTRO_TEXT):
             s = text_with_outline(typing, font_big, (255,220,120), (0,0,0))
             screen.blit(s, (WIDTH//2 - s.get_width()//2, y))
 
-        tip = font_small.render("Нажми ENTER/SPACE — начать", True, (230,230,240))
-        screen.blit(tip, (WIDTH//2 - tip.get_width()//2, HEIGHT-40))
-
         pygame.display.flip(); clock.tick(60)
 
-
 def _draw_attr_menu(title_text, stats, points, selected: str | None = None):
-    tbg = pygame.Surface((WIDTH, HEIGHT)); draw_vertical_gradient(tbg, BG_TOP, BG_BOTTOM)
-    screen.blit(tbg, (0, 0))
+    screen.blit(get_gradient_surface(WIDTH, HEIGHT, BG_TOP, BG_BOTTOM), (0, 0))
     title = text_with_outline(title_text, font_big, (240,240,255), (0,0,0))
     screen.blit(title, (WIDTH//2 - title.get_width()//2, 40))
 
@@ -1317,17 +1573,17 @@ def _draw_attr_menu(title_text, stats, points, selected: str | None = None):
         val = getattr(stats, attr)
         txt = f"{i}. {name}: {val}"
         color = (230,230,240)
-        rect = font_small.render(txt, True, color).get_rect(topleft=(80, 100 + i*32))
+        rect = render_text(txt, font_small, color).get_rect(topleft=(80, 100 + i*32))
         line_rects[attr] = rect
         if rect.collidepoint(mouse_pos):
             hovered = attr
             color = (255,255,160)
         elif selected == attr:
             color = (255,255,160)
-        screen.blit(font_small.render(txt, True, color), rect.topleft)
+        screen.blit(render_text(txt, font_small, color), rect.topleft)
 
-    tip = font_small.render(
-        f"Очки: {points}  (1-7 — увеличить, Enter — продолжить)", True, (230,230,240)
+    tip = render_text(
+        f"Очки: {points}  (1-7 — увеличить, Enter — продолжить)", font_small, (230,230,240)
     )
     screen.blit(tip, (80, HEIGHT-60))
 
@@ -1336,7 +1592,7 @@ def _draw_attr_menu(title_text, stats, points, selected: str | None = None):
         lines = wrap_text(desc, font_small, WIDTH - 160)
         y = HEIGHT - 120
         for line in lines:
-            screen.blit(font_small.render(line, True, UI_MUTE), (80, y))
+            screen.blit(render_text(line, font_small, UI_MUTE), (80, y))
             y += font_small.get_height() + 2
 
 
@@ -1387,6 +1643,12 @@ def show_level_up_menu(player):
         pygame.display.flip(); clock.tick(60)
 
 # ====== GAME STATE (explore/combat) ======
+# Подсказки «E — …» над объектами: текст статичен, рендерится один раз
+E_HINT_DOOR = text_with_outline("E — войти", font_small, (240,240,255), (0,0,0))
+E_HINT_NOTE = text_with_outline("E — прочитать", font_small, (240,240,255), (0,0,0))
+E_HINT_SEARCH = text_with_outline("E — обыскать", font_small, (240,240,255), (0,0,0))
+E_HINT_TALK = text_with_outline("E — поговорить", font_small, (240,240,255), (0,0,0))
+
 class Game:
     def __init__(self, stats: Stats | None = None):
         self.reset(stats)
@@ -1412,6 +1674,9 @@ class Game:
         self.quests = []
         self.dialogue = None
         self.current_npc = None
+        self._near = []           # объекты рядом с игроком (считаются в update)
+        self._frame_sig = None    # снимок всего, что меняет статичную часть кадра
+        self._moving_prev = []    # области подвижных спрайтов на прошлом кадре
         self.action_cd = 0.0
         self.enemy_timer = 0.0
         sword = Item("Степлер-меч", "weapon", damage=2)
@@ -1442,7 +1707,7 @@ class Game:
             txt = random.choice(NOTE_TEMPLATES).format(room=self.piz_room)
             pos = (random.randint(160, WIDTH-160), random.randint(120, HEIGHT-80))
             if self.current_room == name:
-                self.scene.notes.append(Note(pos, txt))
+                self.scene.add_note(Note(pos, txt))
 
     def toast_show(self, text, t=2.2):
         self.toast, self.toast_t = text, t
@@ -1475,7 +1740,7 @@ class Game:
         self.piz_room = random.choice(choices)
         if old == self.current_room:
             pos = (random.randint(140, WIDTH-140), random.randint(120, HEIGHT-120))
-            self.scene.notes.append(Note(pos, f"Меня тут нет! Пойду-ка в {self.piz_room}."))
+            self.scene.add_note(Note(pos, f"Меня тут нет! Пойду-ка в {self.piz_room}."))
 
     def player_idle(self, dt):
         p = self.player
@@ -1486,15 +1751,12 @@ class Game:
             if p.attacking_t <= 0:
                 p._set_state("idle"); p._hit_registered = False
         p.anim_t += dt
-        frames = p.images[p.state]
+        frames = p.frame_rects[(p.state, p.dir.x < -0.2)]
         if frames:
             frame_rate = 0.4 if p.state == "idle" else 0.08
             if p.anim_t >= frame_rate:
                 p.anim_t = 0.0; p.anim_idx = (p.anim_idx + 1) % len(frames)
-            img = frames[p.anim_idx]
-            if p.dir.x < -0.2:
-                img = pygame.transform.flip(img, True, False)
-            p.image = img
+            p.frame_rect = frames[p.anim_idx]
 
     def player_action(self, keys):
         p = self.player
@@ -1535,10 +1797,9 @@ class Game:
                     particles.spawn_hit(self.piz.rect.center, (255,200,60))
                     dmg = calc_damage(p, self.piz)
                     self.piz.hp = max(0, self.piz.hp - dmg)
-                    k = Vector2(self.piz.rect.center) - Vector2(p.rect.center)
-                    k = (k.normalize() if k.length_squared() else Vector2(1,0)) * (KNOCKBACK_PIX_BASE + 6*p.damage_bonus)
-                    if self.piz.is_boss: k *= BOSS_KB_RESIST
-                    self.piz.on_hit(k)
+                    mag = KNOCKBACK_PIX_BASE + 6*p.damage_bonus
+                    if self.piz.is_boss: mag *= BOSS_KB_RESIST
+                    self.piz.on_hit(*knockback(p.rect.center, self.piz.rect.center, mag))
                     self.score += BASE_POINTS
                     leveled = p.add_xp(XP_PER_HIT)
                     p.rage = min(RAGE_MAX, p.rage + RAGE_PER_HIT)
@@ -1567,14 +1828,14 @@ class Game:
         elif keys[pygame.K_LSHIFT] or keys[pygame.K_RSHIFT]:
             if p.try_ult():
                 p.rage = 0; p.ult_cd = ULT_COOLDOWN
-                ec = Vector2(self.piz.rect.center); pc = Vector2(p.rect.center)
-                if ec.distance_to(pc) <= ULT_RADIUS:
+                ec = self.piz.rect.center; pc = p.rect.center
+                dx, dy = ec[0] - pc[0], ec[1] - pc[1]
+                if dx*dx + dy*dy <= ULT_RADIUS*ULT_RADIUS:
                     dmg = ULT_DAMAGE + 3*p.damage_bonus + p.inventory.bonus_damage()
                     self.piz.hp = max(0, self.piz.hp - dmg)
-                    k = (ec - pc)
-                    k = (k.normalize() if k.length_squared() else Vector2(1,0)) * ULT_KNOCKBACK
-                    if self.piz.is_boss: k *= BOSS_KB_RESIST
-                    self.piz.on_hit(k)
+                    mag = ULT_KNOCKBACK
+                    if self.piz.is_boss: mag *= BOSS_KB_RESIST
+                    self.piz.on_hit(*knockback(pc, ec, mag))
                     self.score += 60
                     if self.piz.hp <= 0:
                         self.round += 1
@@ -1600,7 +1861,7 @@ class Game:
             self.enemy_timer -= dt
             if self.enemy_timer > 0:
                 return
-        dist = Vector2(self.piz.rect.center).distance_to(self.player.rect.center)
+        dist = math.dist(self.piz.rect.center, self.player.rect.center)
         self.piz.select_weapon(dist)
         rng = self.piz.weapon.range if self.piz.weapon else ENEMY_ATTACK_RANGE
         if dist <= rng:
@@ -1620,6 +1881,67 @@ class Game:
         if not self.turn_mgr.spend(cost):
             return
 
+    # ---- обработчики клавиш (вызываются через таблицу _KEY_HANDLERS) ----
+    def _key_quit(self, key):
+        pygame.quit(); sys.exit(0)
+
+    def _key_fullscreen(self, key):
+        self.fullscreen = not self.fullscreen
+        flags = pygame.FULLSCREEN|pygame.SCALED if self.fullscreen else pygame.SCALED
+        try:
+            pygame.display.set_mode((WIDTH, HEIGHT), flags, vsync=1)
+        except TypeError:
+            pygame.display.set_mode((WIDTH, HEIGHT), flags)
+        # окно создано заново: следующий кадр выгружается целиком
+        self._frame_sig = None
+
+    def _key_tab(self, key):
+        self.tab_open = not self.tab_open
+
+    def _key_inventory(self, key):
+        self.inv_open = not self.inv_open
+
+    def _key_skills(self, key):
+        self.skill_open = not self.skill_open
+
+    def _key_save(self, key):
+        save_game(self); self.toast_show("Сохранено")
+
+    def _key_load(self, key):
+        if load_game(self): self.toast_show("Загружено")
+
+    _SKILL_KEYS = {pygame.K_1:"damage", pygame.K_2:"speed", pygame.K_3:"cooldown", pygame.K_4:"range"}
+
+    def _key_skill_unlock(self, key):
+        if self.player.skill_points > 0:
+            self.player.skills.unlock(self._SKILL_KEYS[key], self.player)
+
+    def _key_switch_weapon(self, key):
+        w = self.player.inventory.switch_weapon()
+        if w:
+            self.toast_show(f"Экипировано: {w.name}")
+
+    def _key_upgrade_weapon(self, key):
+        if self.inv_open:
+            if self.player.inventory.upgrade_weapon():
+                self.toast_show("Оружие улучшено")
+            else:
+                self.toast_show("Недостаточно монет")
+
+    # клавиша -> обработчик: один поиск в словаре вместо цепочки elif
+    _KEY_HANDLERS = {
+        pygame.K_ESCAPE: _key_quit,
+        pygame.K_F11: _key_fullscreen,
+        pygame.K_TAB: _key_tab,
+        pygame.K_i: _key_inventory,
+        pygame.K_k: _key_skills,
+        pygame.K_F5: _key_save,
+        pygame.K_F9: _key_load,
+        **dict.fromkeys(_SKILL_KEYS, _key_skill_unlock),
+        pygame.K_q: _key_switch_weapon,
+        pygame.K_u: _key_upgrade_weapon,
+    }
+
     def update(self, dt, keys):
         self.action_cd = max(0.0, self.action_cd - dt)
         for e in pygame.event.get():
@@ -1640,54 +1962,27 @@ class Game:
                                 self.toast_show("Улика добавлена")
                             self.state = "explore"; self.dialogue = None
                     continue
-                if e.key == pygame.K_ESCAPE: pygame.quit(); sys.exit(0)
-                elif e.key == pygame.K_F11:
-                    self.fullscreen = not self.fullscreen
-                    flags = pygame.FULLSCREEN|pygame.SCALED if self.fullscreen else pygame.SCALED
-                    try:
-                        pygame.display.set_mode((WIDTH, HEIGHT), flags, vsync=1)
-                    except TypeError:
-                        pygame.display.set_mode((WIDTH, HEIGHT), flags)
-                elif e.key == pygame.K_TAB:
-                    self.tab_open = not self.tab_open
-                elif e.key == pygame.K_i:
-                    self.inv_open = not self.inv_open
-                elif e.key == pygame.K_k:
-                    self.skill_open = not self.skill_open
-                elif e.key == pygame.K_F5:
-                    save_game(self); self.toast_show("Сохранено")
-                elif e.key == pygame.K_F9:
-                    if load_game(self): self.toast_show("Загружено")
-                elif e.key in (pygame.K_1, pygame.K_2, pygame.K_3, pygame.K_4):
-                    if self.player.skill_points > 0:
-                        keymap = {pygame.K_1:"damage", pygame.K_2:"speed", pygame.K_3:"cooldown", pygame.K_4:"range"}
-                        self.player.skills.unlock(keymap[e.key], self.player)
-                elif e.key == pygame.K_q:
-                    w = self.player.inventory.switch_weapon()
-                    if w:
-                        self.toast_show(f"Экипировано: {w.name}")
-                elif e.key == pygame.K_u:
-                    if self.inv_open:
-                        if self.player.inventory.upgrade_weapon():
-                            self.toast_show("Оружие улучшено")
-                        else:
-                            self.toast_show("Недостаточно монет")
+                handler = self._KEY_HANDLERS.get(e.key)
+                if handler:
+                    handler(self, e.key)
 
         if self.state == "dialogue":
             return
         if self.state == "explore":
             self.player.update(dt, keys)
+            # объекты рядом с игроком; render берёт их отсюда для подсказок E
+            near = self._near = self.scene.nearby(self.player.rect)
             # взаимодействие — двери/улики/объекты/NPC
             if keys[pygame.K_e] and self.action_cd <= 0:
                 acted = False
-                for d in self.scene.doors:
-                    if self.player.rect.colliderect(d.rect):
+                for d in near:
+                    if isinstance(d, Door):
                         self.enter_room(d.target)
                         acted = True
                         break
                 if not acted:
-                    for n in self.scene.notes:
-                        if not n.picked and self.player.rect.colliderect(n.rect):
+                    for n in near:
+                        if isinstance(n, Note) and not n.picked:
                             n.picked = True
                             self.notes_log.append(n.text)
                             q = Quest(n.text, goal=1, reward=0)
@@ -1699,14 +1994,14 @@ class Game:
                             acted = True
                             break
                 if not acted:
-                    for obj in self.scene.objects:
-                        if not obj.used and self.player.rect.colliderect(obj.rect):
+                    for obj in near:
+                        if isinstance(obj, InteractiveObject) and not obj.used:
                             obj.interact(self)
                             acted = True
                             break
                 if not acted:
-                    for npc in self.scene.npcs:
-                        if not npc.talked and self.player.rect.colliderect(npc.rect):
+                    for npc in near:
+                        if isinstance(npc, NPC) and not npc.talked:
                             self.dialogue = Dialogue(npc.dialogue_lines)
                             self.state = "dialogue"
                             self.current_npc = npc
@@ -1715,6 +2010,7 @@ class Game:
                             break
                 if acted:
                     self.action_cd = ACTION_DELAY
+                    self._near = self.scene.nearby(self.player.rect)
             # переезд Пиздюка
             self.piz_move_t -= dt
             if self.piz_move_t <= 0:
@@ -1731,34 +2027,49 @@ class Game:
         if self.player.ult_cd > 0: self.player.ult_cd = max(0.0, self.player.ult_cd - dt)
         if self.toast_t > 0: self.toast_t -= dt
 
+    def _frame_signature(self):
+        """Всё, что меняет кадр помимо движения игрока и подсказок E.
+        Пока снимок не меняется, на экран можно выгружать только подвижные области."""
+        p, sc = self.player, self.scene
+        inv = p.inventory
+        w = inv.current_weapon()
+        return (self.state, id(sc), self.piz_room, self.tab_open, self.inv_open, self.skill_open,
+                self.score, p.hp, p.hp_max, p.rage, p.ult_cd, p.xp, p.level, p.skill_points,
+                tuple(it.name for it in inv.items),   # монетки и предметы
+                (id(w), w.upgrade_level, w.damage, w.range) if w else None,
+                self.toast if self.toast_t > 0 else None,
+                tuple((q.progress, q.completed) for q in self.quests),
+                tuple(n.picked for n in sc.notes), tuple(o.used for o in sc.objects),
+                tuple(n.talked for n in sc.npcs))
+
     def render(self, surf):
+        """Рисует кадр. Возвращает None, если экран нужно обновить целиком,
+        иначе список изменившихся прямоугольников (пустой — обновлять нечего)."""
+        sig = self._frame_signature()
+        full = (sig != self._frame_sig or self.state != "explore"
+                or len(particles) or flash_overlay.get_alpha())
+        self._frame_sig = sig
+        moving = []
         self.scene.draw(surf)
         # Пиздюк в бою
         if self.state == "combat" and self.piz:
-            surf.blit(self.piz.image, self.piz.rect)
+            self.piz.draw(surf)
             draw_hp_bar_above(surf, self.piz.rect, self.piz.hp, self.piz.hp_max, is_boss=self.piz.is_boss)
             if self.piz.last_phrase:
                 self.draw_bubble(self.piz.last_phrase, (self.piz.rect.centerx, self.piz.rect.top))
         # Игрок
-        surf.blit(self.player.image, self.player.rect)
+        moving.append(self.player.draw(surf))
         # Подсказки E
         if self.state == "explore":
-              for d in self.scene.doors:
-                  if self.player.rect.colliderect(d.rect):
-                      s = text_with_outline("E — войти", font_small, (240,240,255), (0,0,0))
-                      surf.blit(s, (d.rect.centerx-40, d.rect.y-24))
-              for n in self.scene.notes:
-                  if not n.picked and self.player.rect.colliderect(n.rect):
-                      s = text_with_outline("E — прочитать", font_small, (240,240,255), (0,0,0))
-                      surf.blit(s, (n.rect.centerx-50, n.rect.y-26))
-              for obj in self.scene.objects:
-                  if not obj.used and self.player.rect.colliderect(obj.rect):
-                      s = text_with_outline("E — обыскать", font_small, (240,240,255), (0,0,0))
-                      surf.blit(s, (obj.rect.centerx-55, obj.rect.y-26))
-              for npc in self.scene.npcs:
-                  if not npc.talked and self.player.rect.colliderect(npc.rect):
-                      s = text_with_outline("E — поговорить", font_small, (240,240,255), (0,0,0))
-                      surf.blit(s, (npc.rect.centerx-60, npc.rect.y-26))
+              for o in self._near:
+                  if isinstance(o, Door):
+                      moving.append(surf.blit(E_HINT_DOOR, (o.rect.centerx-40, o.rect.y-24)))
+                  elif isinstance(o, Note) and not o.picked:
+                      moving.append(surf.blit(E_HINT_NOTE, (o.rect.centerx-50, o.rect.y-26)))
+                  elif isinstance(o, InteractiveObject) and not o.used:
+                      moving.append(surf.blit(E_HINT_SEARCH, (o.rect.centerx-55, o.rect.y-26)))
+                  elif isinstance(o, NPC) and not o.talked:
+                      moving.append(surf.blit(E_HINT_TALK, (o.rect.centerx-60, o.rect.y-26)))
 
         # Частицы
         particles.render(surf)
@@ -1778,7 +2089,7 @@ class Game:
             hud_panel(surf, rect)
             lines = wrap_text(self.dialogue.current(), font_mid, rect.width - 32)
             for i, line in enumerate(lines):
-                txt = font_mid.render(line, True, (240,240,255))
+                txt = render_text(line, font_mid, (240,240,255))
                 surf.blit(txt, (rect.x+16, rect.y+16 + i * (font_mid.get_height() + 4)))
 
         # Flash
@@ -1787,9 +2098,16 @@ class Game:
             flash_overlay.set_alpha(max(0, a-12))
             surf.blit(flash_overlay, (0,0))
 
+        # старые и новые места подвижных спрайтов; если их много — проще flip
+        dirty = self._moving_prev + moving
+        self._moving_prev = moving
+        if full or sum(r.w * r.h for r in dirty) > WIDTH * HEIGHT // 4:
+            return None
+        return dirty
+
     def draw_bubble(self, text, pos):
         pad = 8
-        r = font_small.render(text, True, (20,20,24))
+        r = render_text(text, font_small, (20,20,24))
         w, h = r.get_width()+pad*2, r.get_height()+pad*2
         bubble = pygame.Surface((w, h+10), pygame.SRCALPHA)
         pygame.draw.rect(bubble, (255,255,255,235), (0,0,w,h), border_radius=10)
@@ -1821,7 +2139,7 @@ class Game:
         y = 80
         for q in self.quests:
             status = "Готово" if q.completed else f"{q.progress}/{q.goal}"
-            txt = font_small.render(f"{q.desc} [{status}]", True, (240,245,255))
+            txt = render_text(f"{q.desc} [{status}]", font_small, (240,245,255))
             surf.blit(txt, (16, y))
             y += font_small.get_height() + 2
 
@@ -1838,14 +2156,14 @@ class Game:
         lines = wrap_text(hint_text, font_small, WIDTH - 320)
         y = HEIGHT - 150
         for line in lines:
-            txt = font_small.render(line, True, UI_MUTE)
+            txt = render_text(line, font_small, UI_MUTE)
             surf.blit(txt, (WIDTH//2 - txt.get_width()//2, y))
             y += font_small.get_height() + 2
 
         if self.toast_t > 0 and self.toast:
             rect = pygame.Rect(WIDTH//2-300, HEIGHT-90, 600, 46)
             hud_panel(surf, rect)
-            surf.blit(font_mid.render(self.toast, True, (240,240,255)), (rect.x+16, rect.y+10))
+            surf.blit(render_text(self.toast, font_mid, (240,240,255)), (rect.x+16, rect.y+10))
 
 # ====== MAIN ======
 def main():
@@ -1854,8 +2172,11 @@ def main():
     while True:
         events = pygame.event.get()
         res = menu.update(events)
-        menu.draw(screen)
-        pygame.display.flip()
+        dirty = menu.draw(screen)
+        if dirty is None:
+            pygame.display.flip()
+        elif dirty:
+            pygame.display.update(dirty)
         clock.tick(FPS)
         if res == "Играть":
             break
@@ -1873,8 +2194,11 @@ def main():
         now = time.perf_counter(); dt = min(0.03, now-last); last = now
         keys = pygame.key.get_pressed()
         game.update(dt, keys)
-        game.render(screen)
-        pygame.display.flip()
+        dirty = game.render(screen)
+        if dirty is None:
+            pygame.display.flip()
+        elif dirty:
+            pygame.display.update(dirty)
         clock.tick(FPS)
 
 if __name__ == "__main__":
@@ -13,16 +13,20 @@
 from __future__ import annotations
 
 import random
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from enum import Enum
-from typing import Dict, Iterable, List, Optional, Tuple
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 
+import numpy as np
 import pygame
 import math
-from array import array
 
 # ==== Общие настройки ====
 FPS = 60
+# логика идёт фиксированным шагом; после долгой паузы догоняем не больше MAX_FRAME_TIME
+FIXED_STEP = 1.0 / FPS
+MAX_FRAME_TIME = 0.25
 TILE_SIZE = 24
 GRID_SIZE = 26  # поле 26x26, как в оригинальной игре
 PLAY_AREA_WIDTH = GRID_SIZE * TILE_SIZE
@@ -30,6 +34,8 @@ PLAY_AREA_HEIGHT = GRID_SIZE * TILE_SIZE
 PANEL_WIDTH = 200
 SCREEN_WIDTH = PLAY_AREA_WIDTH + PANEL_WIDTH
 SCREEN_HEIGHT = PLAY_AREA_HEIGHT
+STATUS_BAR_WIDTH = PANEL_WIDTH - 32
+MENU_HINT_LINES = ("Стрелки — движение", "Пробел — огонь", "Enter — начать")
 
 PLAYER_LIVES = 3
 PLAYER_SPEED = 96.0
@@ -42,6 +48,7 @@ MAX_TOTAL_ENEMIES = 40
 MAX_ACTIVE_ENEMIES = 4
 ENEMY_FIRE_DELAY = (1.1, 2.2)
 ENEMY_DIRECTION_DELAY = (1.4, 3.0)
+ENEMY_SPAWN_POINTS = ((TILE_SIZE, TILE_SIZE), (TILE_SIZE * 12, TILE_SIZE), (TILE_SIZE * 23, TILE_SIZE))
 
 # ==== Цвета ====
 BG_COLOR = (18, 20, 26)
@@ -71,6 +78,35 @@ def lighten_color(color: Tuple[int, int, int], amount: float) -> Tuple[int, int,
 def darken_color(color: Tuple[int, int, int], amount: float) -> Tuple[int, int, int]:
     return tuple(_clamp_color(c * (1.0 - amount)) for c in color)
 
+
+def vertical_gradient(size: Tuple[int, int], top: Tuple[int, int, int], bottom: Tuple[int, int, int]) -> pygame.Surface:
+    width, height = size
+    t = np.arange(height, dtype=np.float64) / max(1, height - 1)
+    rows = (np.outer(1.0 - t, top) + np.outer(t, bottom)).astype(np.uint8)
+    surface = pygame.Surface(size)
+    # surfarray индексируется [x, y]: одна колонка цветов размножается по ширине
+    pygame.surfarray.blit_array(surface, np.broadcast_to(rows, (width, height, 3)))
+    return surface
+
+
+@lru_cache(maxsize=32)
+def _tank_palette(color: Tuple[int, int, int]) -> Tuple[Tuple[int, int, int], ...]:
+    # base, highlight, shadow, обводка, башня, блик ствола
+    return (
+        color,
+        lighten_color(color, 0.25),
+        darken_color(color, 0.45),
+        darken_color(color, 0.3),
+        darken_color(color, 0.2),
+        lighten_color(color, 0.4),
+    )
+
+
+@lru_cache(maxsize=128)
+def render_text(text: str, font: pygame.font.Font, color: Tuple[int, int, int]) -> pygame.Surface:
+    """font.render с кэшем: надписи панели и экранов состояний рендерятся один раз."""
+    return font.render(text, True, color)
+
 # ==== Карта уровня (26x26) ====
 LEVEL_LAYOUT = """
 ..........................
@@ -108,9 +144,22 @@ class Direction(Enum):
     DOWN = (0, 1)
     LEFT = (-1, 0)
 
-    @property
-    def vector(self) -> pygame.Vector2:
-        return pygame.Vector2(self.value)
+
+# Компоненты направления — готовые числа на самих членах перечисления,
+# чтобы в горячих местах не создавать Vector2 на каждое обращение
+for _direction in Direction:
+    _direction.dx, _direction.dy = _direction.value
+del _direction
+
+_ALL_DIRECTIONS: Tuple[Direction, ...] = tuple(Direction)
+
+# клавиши движения игрока в порядке приоритета
+PLAYER_MOVE_KEYS: Tuple[Tuple[int, Direction], ...] = (
+    (pygame.K_UP, Direction.UP),
+    (pygame.K_DOWN, Direction.DOWN),
+    (pygame.K_LEFT, Direction.LEFT),
+    (pygame.K_RIGHT, Direction.RIGHT),
+)
 
 
 class TileType(Enum):
@@ -155,9 +204,13 @@ CHAR_TO_TILE: Dict[str, Optional[TileType]] = {
 
 
 class SoundManager:
+    # один и тот же звук не чаще раза в MIN_INTERVAL_MS: залп попаданий за кадр сливается в одно воспроизведение
+    MIN_INTERVAL_MS = 20
+
     def __init__(self) -> None:
         self.available = False
         self.sounds: Dict[str, pygame.mixer.Sound] = {}
+        self._last_play: Dict[str, int] = {}
 
     def initialize(self) -> None:
         try:
@@ -181,36 +234,39 @@ class SoundManager:
         if not self.available:
             return
         sound = self.sounds.get(name)
-        if sound is not None:
-            sound.play()
+        if sound is None:
+            return
+        now = pygame.time.get_ticks()
+        last = self._last_play.get(name)
+        if last is not None and now - last < self.MIN_INTERVAL_MS:
+            return
+        self._last_play[name] = now
+        sound.play()
 
     @staticmethod
     def _generate_tone(frequency: float, duration: float, volume: float) -> pygame.mixer.Sound:
         sample_rate = 44100
         n_samples = int(sample_rate * duration)
         amplitude = int(volume * 32767)
-        buffer = array("h")
-        for i in range(n_samples):
-            sample = int(amplitude * math.sin(2.0 * math.pi * frequency * (i / sample_rate)))
-            buffer.append(sample)
-            buffer.append(sample)
-        return pygame.mixer.Sound(buffer=buffer.tobytes())
+        t = np.arange(n_samples, dtype=np.float64) / sample_rate
+        samples = (amplitude * np.sin(2.0 * math.pi * frequency * t)).astype(np.int16)
+        # стерео: каждый отсчёт дублируется в оба канала
+        return pygame.mixer.Sound(buffer=np.repeat(samples, 2).tobytes())
 
     @staticmethod
     def _generate_noise(duration: float, volume: float) -> pygame.mixer.Sound:
         sample_rate = 44100
         n_samples = int(sample_rate * duration)
         amplitude = int(volume * 32767)
-        buffer = array("h")
-        random_value = random.random
-        for _ in range(n_samples):
-            sample = int(amplitude * (random_value() * 2.0 - 1.0))
-            buffer.append(sample)
-            buffer.append(sample)
-        return pygame.mixer.Sound(buffer=buffer.tobytes())
+        noise = np.random.default_rng().random(n_samples) * 2.0 - 1.0
+        samples = (amplitude * noise).astype(np.int16)
+        return pygame.mixer.Sound(buffer=np.repeat(samples, 2).tobytes())
 
 
 class ImpactEffect:
+    # эффектов на экране десятки и они живут доли секунды: слоты дешевле словаря атрибутов
+    __slots__ = ("position", "color", "radius", "duration", "thickness", "elapsed")
+
     def __init__(self, position: Tuple[float, float], color: Tuple[int, int, int], radius: float = 16.0, duration: float = 0.35, thickness: int = 3):
         self.position = pygame.Vector2(position)
         self.color = color
@@ -258,6 +314,54 @@ BONUS_DEFINITIONS: Dict[BonusType, BonusDefinition] = {
 }
 
 
+@lru_cache(maxsize=64)
+def _bonus_sprite(bonus_type: BonusType, draw_width: int, draw_height: int) -> pygame.Surface:
+    """Свечение, плашка и иконка бонуса заданного размера одним спрайтом."""
+    definition = BONUS_DEFINITIONS[bonus_type]
+    # пульсация даёт всего несколько размеров, поэтому спрайты кэшируются
+    size = max(draw_width, draw_height) + 10
+    surface = pygame.Surface((size, size), pygame.SRCALPHA)
+    pygame.draw.circle(surface, (*definition.glow, 80), (size // 2, size // 2), size // 2)
+    draw_rect = pygame.Rect(0, 0, draw_width, draw_height)
+    draw_rect.center = (size // 2, size // 2)
+    pygame.draw.rect(surface, definition.color, draw_rect, border_radius=8)
+    pygame.draw.rect(surface, definition.border, draw_rect, 2, border_radius=8)
+    icon_rect = draw_rect.inflate(-10, -10)
+    if definition.icon == "shield":
+        top = (icon_rect.centerx, icon_rect.top)
+        left = (icon_rect.left, icon_rect.centery)
+        right = (icon_rect.right, icon_rect.centery)
+        bottom = (icon_rect.centerx, icon_rect.bottom)
+        pygame.draw.polygon(surface, definition.border, [top, right, bottom, left])
+    elif definition.icon == "bolt":
+        points = [
+            (icon_rect.centerx - 6, icon_rect.top),
+            (icon_rect.centerx + 2, icon_rect.centery - 4),
+            (icon_rect.centerx - 4, icon_rect.centery - 2),
+            (icon_rect.centerx + 6, icon_rect.bottom),
+            (icon_rect.centerx - 2, icon_rect.centery + 2),
+            (icon_rect.centerx + 4, icon_rect.centery + 4),
+        ]
+        pygame.draw.polygon(surface, definition.border, points)
+    elif definition.icon == "wing":
+        pygame.draw.ellipse(surface, definition.border, icon_rect)
+        wing_rect = icon_rect.inflate(-icon_rect.width // 4, -icon_rect.height // 3)
+        pygame.draw.ellipse(surface, definition.color, wing_rect)
+    elif definition.icon == "heart":
+        radius = icon_rect.width // 4
+        center_left = (icon_rect.left + radius, icon_rect.top + radius)
+        center_right = (icon_rect.right - radius, icon_rect.top + radius)
+        bottom_point = (icon_rect.centerx, icon_rect.bottom)
+        pygame.draw.circle(surface, definition.border, center_left, radius)
+        pygame.draw.circle(surface, definition.border, center_right, radius)
+        pygame.draw.polygon(surface, definition.border, [
+            (icon_rect.left, icon_rect.top + radius),
+            bottom_point,
+            (icon_rect.right, icon_rect.top + radius),
+        ])
+    return surface
+
+
 class Bonus:
     SIZE = TILE_SIZE - 6
 
@@ -268,66 +372,24 @@ class Bonus:
         self.rect.center = (int(self.position.x), int(self.position.y))
         self.timer = 14.0
         self.pulse = 0.0
+        self._draw_size = self._pulse_size()
 
     def update(self, dt: float) -> None:
         self.timer -= dt
         self.pulse += dt * 4.0
+        self._draw_size = self._pulse_size()
+
+    def _pulse_size(self) -> Tuple[int, int]:
+        pulse_scale = 1.0 + 0.08 * math.sin(self.pulse)
+        return int(self.rect.width * pulse_scale), int(self.rect.height * pulse_scale)
 
     @property
     def expired(self) -> bool:
         return self.timer <= 0.0
 
     def draw(self, surface: pygame.Surface) -> None:
-        definition = BONUS_DEFINITIONS[self.type]
-        pulse_scale = 1.0 + 0.08 * math.sin(self.pulse)
-        draw_width = int(self.rect.width * pulse_scale)
-        draw_height = int(self.rect.height * pulse_scale)
-        draw_rect = pygame.Rect(0, 0, draw_width, draw_height)
-        draw_rect.center = self.rect.center
-        glow_radius = max(draw_rect.width, draw_rect.height) + 10
-        glow_surface = pygame.Surface((glow_radius, glow_radius), pygame.SRCALPHA)
-        pygame.draw.circle(
-            glow_surface,
-            (*definition.glow, 80),
-            (glow_radius // 2, glow_radius // 2),
-            glow_radius // 2,
-        )
-        surface.blit(glow_surface, glow_surface.get_rect(center=draw_rect.center))
-        pygame.draw.rect(surface, definition.color, draw_rect, border_radius=8)
-        pygame.draw.rect(surface, definition.border, draw_rect, 2, border_radius=8)
-        icon_rect = draw_rect.inflate(-10, -10)
-        if definition.icon == "shield":
-            top = (icon_rect.centerx, icon_rect.top)
-            left = (icon_rect.left, icon_rect.centery)
-            right = (icon_rect.right, icon_rect.centery)
-            bottom = (icon_rect.centerx, icon_rect.bottom)
-            pygame.draw.polygon(surface, definition.border, [top, right, bottom, left])
-        elif definition.icon == "bolt":
-            points = [
-                (icon_rect.centerx - 6, icon_rect.top),
-                (icon_rect.centerx + 2, icon_rect.centery - 4),
-                (icon_rect.centerx - 4, icon_rect.centery - 2),
-                (icon_rect.centerx + 6, icon_rect.bottom),
-                (icon_rect.centerx - 2, icon_rect.centery + 2),
-                (icon_rect.centerx + 4, icon_rect.centery + 4),
-            ]
-            pygame.draw.polygon(surface, definition.border, points)
-        elif definition.icon == "wing":
-            pygame.draw.ellipse(surface, definition.border, icon_rect)
-            wing_rect = icon_rect.inflate(-icon_rect.width // 4, -icon_rect.height // 3)
-            pygame.draw.ellipse(surface, definition.color, wing_rect)
-        elif definition.icon == "heart":
-            radius = icon_rect.width // 4
-            center_left = (icon_rect.left + radius, icon_rect.top + radius)
-            center_right = (icon_rect.right - radius, icon_rect.top + radius)
-            bottom_point = (icon_rect.centerx, icon_rect.bottom)
-            pygame.draw.circle(surface, definition.border, center_left, radius)
-            pygame.draw.circle(surface, definition.border, center_right, radius)
-            pygame.draw.polygon(surface, definition.border, [
-                (icon_rect.left, icon_rect.top + radius),
-                bottom_point,
-                (icon_rect.right, icon_rect.top + radius),
-            ])
+        sprite = _bonus_sprite(self.type, *self._draw_size)
+        surface.blit(sprite, sprite.get_rect(center=self.rect.center))
 
 
 class TileArtCache:
@@ -337,7 +399,8 @@ class TileArtCache:
     def get_surface(cls, tile_type: TileType) -> pygame.Surface:
         surface = cls._cache.get(tile_type)
         if surface is None:
-            surface = cls._create_surface(tile_type)
+            # формат экрана: SDL блитит такие поверхности без пересчёта пикселей
+            surface = cls._create_surface(tile_type).convert_alpha()
             cls._cache[tile_type] = surface
         return surface
 
@@ -410,20 +473,29 @@ class TileArtCache:
         return surface
 
 
-@dataclass
 class Tile:
-    grid_x: int
-    grid_y: int
-    definition: TileDefinition
-    rect: pygame.Rect
-    surface: pygame.Surface = field(init=False)
+    """Клетка уровня. Свойства определения скопированы в слоты самой клетки,
+    чтобы проверки столкновений не ходили по цепочке tile.definition.*."""
+
+    __slots__ = (
+        "grid_x", "grid_y", "rect", "definition", "tile_type", "surface",
+        "passable", "bullet_block", "destructible", "overlay",
+    )
+
+    def __init__(self, grid_x: int, grid_y: int, definition: TileDefinition, rect: pygame.Rect):
+        self.grid_x = grid_x
+        self.grid_y = grid_y
+        self.rect = rect
+        self.set_definition(definition)
 
     def set_definition(self, definition: TileDefinition) -> None:
         self.definition = definition
+        self.tile_type = definition.tile_type
         self.surface = TileArtCache.get_surface(definition.tile_type)
-
-    def __post_init__(self) -> None:
-        self.surface = TileArtCache.get_surface(self.definition.tile_type)
+        self.passable = definition.passable
+        self.bullet_block = definition.bullet_block
+        self.destructible = definition.destructible
+        self.overlay = definition.overlay
 
 
 def parse_level_layout(raw: str) -> List[str]:
@@ -432,7 +504,14 @@ def parse_level_layout(raw: str) -> List[str]:
     return [row.ljust(width, ".") for row in rows]
 
 
+# макет разбирается один раз при загрузке модуля, а не на каждый этап
+STAGE_LAYOUT = parse_level_layout(LEVEL_LAYOUT)
+
+
 class Level:
+    # разобранный макет и собранный слой статичных тайлов; новый этап берёт их отсюда
+    _layout_cache: Dict[Tuple[str, ...], Tuple[List[Tuple[int, int, TileType]], pygame.Surface]] = {}
+
     def __init__(self, layout: List[str]):
         self.layout = layout
         self.width = len(layout[0])
@@ -441,26 +520,69 @@ class Level:
             raise ValueError("Макет уровня должен быть 26x26 для корректной работы")
         self.pixel_width = self.width * TILE_SIZE
         self.pixel_height = self.height * TILE_SIZE
-        self.tiles: Dict[Tuple[int, int], Tile] = {}
+        # плотная сетка grid[y][x]: прямая индексация без кортежей-ключей
+        self.grid: List[List[Optional[Tile]]] = [[None] * self.width for _ in range(self.height)]
+        # 1 — клетка непроходима для танков; строка проверяется bytearray.find без обхода тайлов
+        self.solid: List[bytearray] = [bytearray(self.width) for _ in range(self.height)]
+        # то же для пуль: 1 — клетка держит пулю (bullet_block)
+        self.bullet_solid: List[bytearray] = [bytearray(self.width) for _ in range(self.height)]
         self.base_tiles: List[Tile] = []
-        self.overlay_tiles: List[Tile] = []
+        self.overlay_tiles: Set[Tile] = set()
         self.base_alive = True
+        # клетки, перерисованные на слое с прошлого кадра; их забирает Game для display.update
+        self.dirty_rects: List[pygame.Rect] = []
         self._build_tiles()
 
     def _build_tiles(self) -> None:
-        for y, row in enumerate(self.layout):
-            for x, ch in enumerate(row):
-                tile_type = CHAR_TO_TILE.get(ch)
-                if tile_type is None:
-                    continue
-                definition = TILE_DEFINITIONS[tile_type]
-                rect = pygame.Rect(x * TILE_SIZE, y * TILE_SIZE, TILE_SIZE, TILE_SIZE)
-                tile = Tile(x, y, definition, rect)
-                self.tiles[(x, y)] = tile
-                if tile.definition.overlay:
-                    self.overlay_tiles.append(tile)
-                if tile_type == TileType.BASE:
-                    self.base_tiles.append(tile)
+        key = tuple(self.layout)
+        cached = self._layout_cache.get(key)
+        if cached is None:
+            cached = self._prepare_layout(self.layout)
+            self._layout_cache[key] = cached
+        records, layer = cached
+        grid, solid, bullet_solid = self.grid, self.solid, self.bullet_solid
+        for x, y, tile_type in records:
+            rect = pygame.Rect(x * TILE_SIZE, y * TILE_SIZE, TILE_SIZE, TILE_SIZE)
+            tile = Tile(x, y, TILE_DEFINITIONS[tile_type], rect)
+            grid[y][x] = tile
+            if not tile.passable:
+                solid[y][x] = 1
+            if tile.bullet_block:
+                bullet_solid[y][x] = 1
+            if tile.overlay:
+                self.overlay_tiles.add(tile)
+            if tile_type == TileType.BASE:
+                self.base_tiles.append(tile)
+        # слой меняется при разрушении кирпичей, поэтому у уровня своя копия
+        self._static_surf = layer.copy()
+
+    @staticmethod
+    def _prepare_layout(layout: List[str]) -> Tuple[List[Tuple[int, int, TileType]], pygame.Surface]:
+        """Разбор макета в список (x, y, тип) и слой неизменных (не лесных) тайлов."""
+        width = len(layout[0])
+        records: List[Tuple[int, int, TileType]] = []
+        stamps = []
+        # макет одной строкой: индекс ячейки раскладывается на x, y делением
+        for index, ch in enumerate("".join(layout)):
+            tile_type = CHAR_TO_TILE.get(ch)
+            if tile_type is None:
+                continue
+            y, x = divmod(index, width)
+            records.append((x, y, tile_type))
+            if not TILE_DEFINITIONS[tile_type].overlay:
+                rect = (x * TILE_SIZE, y * TILE_SIZE)
+                stamps.append((TileArtCache.get_surface(tile_type), rect, None, pygame.BLEND_RGBA_MAX))
+        # готовые штампы TileArtCache ложатся на пустой слой одним вызовом blits
+        layer = pygame.Surface((width * TILE_SIZE, len(layout) * TILE_SIZE), pygame.SRCALPHA).convert_alpha()
+        layer.blits(stamps, doreturn=False)
+        return records, layer
+
+    def _paint_tile(self, tile: Tile) -> None:
+        if tile.overlay:
+            return
+        # MAX по прозрачному слою — точная копия пикселей тайла вместе с альфой
+        self._static_surf.fill((0, 0, 0, 0), tile.rect)
+        self._static_surf.blit(tile.surface, tile.rect, special_flags=pygame.BLEND_RGBA_MAX)
 
     def iter_tiles(self, rect: pygame.Rect) -> Iterable[Tile]:
         left = max(rect.left // TILE_SIZE, 0)
@@ -468,49 +590,71 @@ class Level:
         top = max(rect.top // TILE_SIZE, 0)
         bottom = min((rect.bottom - 1) // TILE_SIZE, self.height - 1)
         for gy in range(top, bottom + 1):
+            row = self.grid[gy]
             for gx in range(left, right + 1):
-                tile = self.tiles.get((gx, gy))
+                tile = row[gx]
                 if tile is not None:
                     yield tile
 
     def is_rect_blocked(self, rect: pygame.Rect) -> bool:
-        if rect.left < 0 or rect.top < 0:
-            return True
-        if rect.right > self.pixel_width or rect.bottom > self.pixel_height:
+        # горячий путь: границы и поиск по байтовой маске без обращения к тайлам
+        left, top = rect.left, rect.top
+        right, bottom = rect.right - 1, rect.bottom - 1
+        if left < 0 or top < 0 or right >= self.pixel_width or bottom >= self.pixel_height:
             return True
-        for tile in self.iter_tiles(rect):
-            if not tile.definition.passable:
+        solid = self.solid
+        gx0, gx1 = left // TILE_SIZE, right // TILE_SIZE + 1
+        for gy in range(top // TILE_SIZE, bottom // TILE_SIZE + 1):
+            if solid[gy].find(1, gx0, gx1) != -1:
                 return True
         return False
 
     def handle_bullet_collision(self, rect: pygame.Rect) -> Optional[str]:
-        for tile in list(self.iter_tiles(rect)):
-            definition = tile.definition
-            if tile.definition.tile_type == TileType.FOREST:
-                continue
-            if tile.definition.tile_type == TileType.ICE:
-                continue
-            if not definition.bullet_block:
-                continue
-            if definition.tile_type == TileType.BASE:
-                if self.base_alive:
-                    self.base_alive = False
-                    for base_tile in self.base_tiles:
-                        base_tile.set_definition(TILE_DEFINITIONS[TileType.BASE_RUIN])
-                    return "base"
-            if definition.destructible:
-                self.tiles.pop((tile.grid_x, tile.grid_y), None)
-                if tile in self.overlay_tiles:
-                    self.overlay_tiles.remove(tile)
-                return "brick"
-            return "block"
+        # пуля может частично вылезти за поле — индексы обрезаются, как в iter_tiles
+        gx0 = max(rect.left // TILE_SIZE, 0)
+        gx1 = min((rect.right - 1) // TILE_SIZE, self.width - 1) + 1
+        gy0 = max(rect.top // TILE_SIZE, 0)
+        gy1 = min((rect.bottom - 1) // TILE_SIZE, self.height - 1) + 1
+        # частый случай — пуля в пустых клетках: решается по маске, без обращения к тайлам
+        bullet_solid = self.bullet_solid
+        for gy in range(gy0, gy1):
+            if bullet_solid[gy].find(1, gx0, gx1) != -1:
+                break
+        else:
+            return None
+        grid = self.grid
+        for gy in range(gy0, gy1):
+            row = grid[gy]
+            for gx in range(gx0, gx1):
+                tile = row[gx]
+                # лес и лёд пули не держат (bullet_block = False)
+                if tile is None or not tile.bullet_block:
+                    continue
+                if tile.tile_type == TileType.BASE:
+                    if self.base_alive:
+                        self.base_alive = False
+                        for base_tile in self.base_tiles:
+                            base_tile.set_definition(TILE_DEFINITIONS[TileType.BASE_RUIN])
+                            self._paint_tile(base_tile)
+                            self.dirty_rects.append(base_tile.rect)
+                        return "base"
+                if tile.destructible:
+                    row[gx] = None
+                    self.solid[gy][gx] = 0
+                    bullet_solid[gy][gx] = 0
+                    self._static_surf.fill((0, 0, 0, 0), tile.rect)
+                    self.overlay_tiles.discard(tile)
+                    self.dirty_rects.append(tile.rect)
+                    return "brick"
+                return "block"
         return None
 
-    def draw(self, surface: pygame.Surface) -> None:
-        for tile in self.tiles.values():
-            if tile.definition.overlay:
-                continue
-            surface.blit(tile.surface, tile.rect)
+    def draw(self, surface: pygame.Surface, area: Optional[pygame.Rect] = None) -> None:
+        """Рисует статичный слой целиком или только участок area (в тех же координатах)."""
+        if area is None:
+            surface.blit(self._static_surf, (0, 0))
+        else:
+            surface.blit(self._static_surf, area, area)
 
     def draw_overlay(self, surface: pygame.Surface) -> None:
         for tile in self.overlay_tiles:
@@ -519,30 +663,44 @@ class Level:
 
 class Bullet:
     SIZE = 6
+    _sprite: Optional[pygame.Surface] = None
 
-    def __init__(self, position: pygame.Vector2, direction: Direction, speed: float, owner: "Tank", friendly: bool):
-        self.position = pygame.Vector2(position)
+    def __init__(self, position: Tuple[float, float], direction: Direction, speed: float, owner: "Tank", friendly: bool):
+        # центр пули скалярами, как позиция танка
+        self._x, self._y = position
         self.direction = direction
         self.speed = speed
         self.owner = owner
         self.friendly = friendly
         self.rect = pygame.Rect(0, 0, self.SIZE, self.SIZE)
-        self.rect.center = (round(self.position.x), round(self.position.y))
+        self.rect.center = (round(self._x), round(self._y))
 
     def update(self, dt: float) -> None:
-        self.position += self.direction.vector * self.speed * dt
-        self.rect.center = (round(self.position.x), round(self.position.y))
+        step = self.speed * dt
+        self._x += self.direction.dx * step
+        self._y += self.direction.dy * step
+        self.rect.center = (round(self._x), round(self._y))
+
+    @classmethod
+    def get_sprite(cls) -> pygame.Surface:
+        if cls._sprite is None:
+            # свечение и корпус пули в одном спрайте, корпус поверх свечения непрозрачный
+            surface = pygame.Surface((cls.SIZE + 6, cls.SIZE + 6), pygame.SRCALPHA)
+            pygame.draw.ellipse(surface, (*lighten_color(BULLET_COLOR, 0.25), 80), surface.get_rect())
+            body = pygame.Rect(3, 3, cls.SIZE, cls.SIZE)
+            pygame.draw.rect(surface, BULLET_COLOR, body, border_radius=3)
+            inner = body.inflate(-2, -2)
+            if inner.width > 0 and inner.height > 0:
+                pygame.draw.rect(surface, lighten_color(BULLET_COLOR, 0.35), inner, border_radius=2)
+            pygame.draw.rect(surface, darken_color(BULLET_COLOR, 0.5), body, 1, border_radius=3)
+            cls._sprite = surface.convert_alpha()
+        return cls._sprite
+
+    def blit_item(self) -> Tuple[pygame.Surface, Tuple[int, int]]:
+        return self.get_sprite(), (self.rect.x - 3, self.rect.y - 3)
 
     def draw(self, surface: pygame.Surface) -> None:
-        glow_rect = self.rect.inflate(6, 6)
-        glow_surface = pygame.Surface(glow_rect.size, pygame.SRCALPHA)
-        pygame.draw.ellipse(glow_surface, (*lighten_color(BULLET_COLOR, 0.25), 80), glow_surface.get_rect())
-        surface.blit(glow_surface, glow_rect.topleft)
-        pygame.draw.rect(surface, BULLET_COLOR, self.rect, border_radius=3)
-        inner = self.rect.inflate(-2, -2)
-        if inner.width > 0 and inner.height > 0:
-            pygame.draw.rect(surface, lighten_color(BULLET_COLOR, 0.35), inner, border_radius=2)
-        pygame.draw.rect(surface, darken_color(BULLET_COLOR, 0.5), self.rect, 1, border_radius=3)
+        surface.blit(*self.blit_item())
 
 
 class Tank:
@@ -556,9 +714,13 @@ class Tank:
         bullet_speed: float,
         friendly: bool,
     ):
-        self.pos = pygame.Vector2(x, y)
+        # дробная позиция хранится скалярами, rect — её округление
+        self._x = float(x)
+        self._y = float(y)
         self.rect = pygame.Rect(int(x), int(y), TILE_SIZE, TILE_SIZE)
         self.color = color
+        # цвет мигания при неуязвимости считается один раз, а не каждый кадр
+        self._flash_color = lighten_color(color, 0.4)
         self.speed = speed
         self.fire_delay = fire_delay
         self.bullet_speed = bullet_speed
@@ -578,32 +740,34 @@ class Tank:
 
     def _try_axis_move(self, dx: float, dy: float, level: Level, others: Iterable["Tank"]) -> bool:
         moved = False
+        # прямоугольники соседей собираются один раз на ход и проверяются одним collidelist
+        blockers = self._blocking_rects(others)
+        rect = self.rect
+        x, y = self._x, self._y
         if dx != 0:
-            new_pos_x = self.pos.x + dx
-            test_rect = pygame.Rect(int(round(new_pos_x)), int(round(self.pos.y)), self.rect.width, self.rect.height)
-            if not level.is_rect_blocked(test_rect) and not self._collides_with_others(test_rect, others):
-                self.pos.x = new_pos_x
+            nx = x + dx
+            test_rect = pygame.Rect(round(nx), round(y), rect.width, rect.height)
+            if not level.is_rect_blocked(test_rect) and test_rect.collidelist(blockers) == -1:
+                x = self._x = nx
                 moved = True
         if dy != 0:
-            new_pos_y = self.pos.y + dy
-            test_rect = pygame.Rect(int(round(self.pos.x)), int(round(new_pos_y)), self.rect.width, self.rect.height)
-            if not level.is_rect_blocked(test_rect) and not self._collides_with_others(test_rect, others):
-                self.pos.y = new_pos_y
+            ny = y + dy
+            test_rect = pygame.Rect(round(x), round(ny), rect.width, rect.height)
+            if not level.is_rect_blocked(test_rect) and test_rect.collidelist(blockers) == -1:
+                y = self._y = ny
                 moved = True
-        self.rect.topleft = (int(round(self.pos.x)), int(round(self.pos.y)))
+        rect.x = round(x)
+        rect.y = round(y)
         return moved
 
     @staticmethod
-    def _collides_with_others(rect: pygame.Rect, others: Iterable["Tank"]) -> bool:
-        for other in others:
-            if getattr(other, "active", True) and rect.colliderect(other.rect):
-                return True
-        return False
+    def _blocking_rects(others: Iterable["Tank"]) -> List[pygame.Rect]:
+        return [other.rect for other in others if getattr(other, "active", True)]
 
     def move(self, direction: Direction, dt: float, level: Level, others: Iterable["Tank"]) -> bool:
         self.direction = direction
-        vec = direction.vector * self.speed * dt
-        return self._try_axis_move(vec.x, vec.y, level, others)
+        step = self.speed * dt
+        return self._try_axis_move(direction.dx * step, direction.dy * step, level, others)
 
     def can_fire(self) -> bool:
         return self.cooldown_timer <= 0 and self.active_bullets < self.max_bullets
@@ -611,9 +775,10 @@ class Tank:
     def fire(self) -> Optional[Bullet]:
         if not self.can_fire():
             return None
-        muzzle = pygame.Vector2(self.rect.center)
-        muzzle += self.direction.vector * (self.rect.width / 2 + Bullet.SIZE / 2)
-        bullet = Bullet(muzzle, self.direction, self.bullet_speed, self, self.friendly)
+        offset = self.MUZZLE_OFFSET
+        direction = self.direction
+        muzzle = (self.rect.centerx + direction.dx * offset, self.rect.centery + direction.dy * offset)
+        bullet = Bullet(muzzle, direction, self.bullet_speed, self, self.friendly)
         self.cooldown_timer = self.fire_delay
         self.active_bullets += 1
         return bullet
@@ -626,14 +791,28 @@ class Tank:
         self.health -= amount
         return self.health <= 0
 
-    def draw(self, surface: pygame.Surface) -> None:
-        base_color = self.color
-        if self.invulnerable_timer > 0 and int(self.invulnerable_timer * 6) % 2 == 0:
-            base_color = lighten_color(self.color, 0.4)
-        highlight = lighten_color(base_color, 0.25)
-        shadow = darken_color(base_color, 0.45)
-        body_rect = self.rect
-        track_width = max(4, body_rect.width // 5)
+    # пуля появляется сразу за краем танка
+    MUZZLE_OFFSET = TILE_SIZE / 2 + Bullet.SIZE / 2
+    # ствол выходит за клетку, поэтому спрайт шире танка на SPRITE_PAD с каждой стороны
+    SPRITE_PAD = 10
+    _sprites: Dict[Tuple[Tuple[int, int, int], Direction], pygame.Surface] = {}
+
+    @classmethod
+    def get_sprite(cls, color: Tuple[int, int, int], direction: Direction) -> pygame.Surface:
+        key = (color, direction)
+        sprite = cls._sprites.get(key)
+        if sprite is None:
+            sprite = cls._create_sprite(color, direction).convert_alpha()
+            cls._sprites[key] = sprite
+        return sprite
+
+    @classmethod
+    def _create_sprite(cls, color: Tuple[int, int, int], direction: Direction) -> pygame.Surface:
+        pad = cls.SPRITE_PAD
+        surface = pygame.Surface((TILE_SIZE + pad * 2, TILE_SIZE + pad * 2), pygame.SRCALPHA)
+        base_color, highlight, shadow, outline, turret, barrel_light = _tank_palette(color)
+        body_rect = pygame.Rect(pad, pad, TILE_SIZE, TILE_SIZE)
+        track_width = max(4, TILE_SIZE // 5)
         left_track = pygame.Rect(body_rect.left, body_rect.top + 1, track_width, body_rect.height - 2)
         right_track = pygame.Rect(body_rect.right - track_width, body_rect.top + 1, track_width, body_rect.height - 2)
         pygame.draw.rect(surface, shadow, left_track, border_radius=2)
@@ -641,16 +820,44 @@ class Tank:
         center_rect = body_rect.inflate(-track_width * 2 + 2, -4)
         pygame.draw.rect(surface, base_color, center_rect, border_radius=4)
         pygame.draw.rect(surface, highlight, center_rect.inflate(-4, -4), border_radius=3)
-        pygame.draw.rect(surface, darken_color(base_color, 0.3), center_rect, 2, border_radius=4)
+        pygame.draw.rect(surface, outline, center_rect, 2, border_radius=4)
         turret_rect = center_rect.inflate(-6, -6)
         if turret_rect.width > 0 and turret_rect.height > 0:
-            pygame.draw.rect(surface, darken_color(base_color, 0.2), turret_rect, border_radius=3)
+            pygame.draw.rect(surface, turret, turret_rect, border_radius=3)
             pygame.draw.rect(surface, highlight, turret_rect.inflate(-3, -3), border_radius=2)
-        barrel_start = pygame.Vector2(body_rect.center)
-        barrel_length = body_rect.width // 2 + 6
-        barrel_end = barrel_start + self.direction.vector * barrel_length
-        pygame.draw.line(surface, shadow, barrel_start, barrel_end, 6)
-        pygame.draw.line(surface, lighten_color(base_color, 0.4), barrel_start, barrel_end, 2)
+        cx, cy = body_rect.center
+        barrel_length = TILE_SIZE // 2 + 6
+        barrel_end = (cx + direction.dx * barrel_length, cy + direction.dy * barrel_length)
+        pygame.draw.line(surface, shadow, (cx, cy), barrel_end, 6)
+        pygame.draw.line(surface, barrel_light, (cx, cy), barrel_end, 2)
+        return surface
+
+    def blit_item(self) -> Tuple[pygame.Surface, Tuple[int, int]]:
+        """Пара (спрайт, позиция) для Surface.blits."""
+        color = self.color
+        if self.invulnerable_timer > 0 and int(self.invulnerable_timer * 6) % 2 == 0:
+            color = self._flash_color
+        pad = self.SPRITE_PAD
+        return self.get_sprite(color, self.direction), (self.rect.x - pad, self.rect.y - pad)
+
+    def draw(self, surface: pygame.Surface) -> None:
+        surface.blit(*self.blit_item())
+
+@lru_cache(maxsize=96)
+def _player_glow(size: int, alpha: int) -> pygame.Surface:
+    # альфа пульсирует в пределах 50..130, так что кругов в кэше немного
+    glow_surface = pygame.Surface((size, size), pygame.SRCALPHA)
+    pygame.draw.circle(glow_surface, (120, 220, 255, alpha), (size // 2, size // 2), size // 2)
+    return glow_surface
+
+
+@lru_cache(maxsize=1)
+def _speed_trail() -> pygame.Surface:
+    # три штриха следа ускорения одним спрайтом, сверху вниз с шагом 4 px
+    trail_surface = pygame.Surface((6, 12), pygame.SRCALPHA)
+    for top in (0, 4, 8):
+        pygame.draw.rect(trail_surface, (180, 255, 160, 140), (0, top, 6, 4), border_radius=2)
+    return trail_surface
 
 
 class PlayerTank(Tank):
@@ -711,7 +918,7 @@ class PlayerTank(Tank):
 
     def reset_position(self, x: float, y: float) -> None:
         self.spawn_point.update(x, y)
-        self.pos.update(x, y)
+        self._x, self._y = float(x), float(y)
         self.rect.topleft = (int(x), int(y))
         self.direction = Direction.UP
         self.cooldown_timer = 0.0
@@ -743,7 +950,7 @@ class PlayerTank(Tank):
             if spawn_rect.colliderect(enemy.rect):
                 self.respawn_timer = 0.25
                 return
-        self.pos.update(self.spawn_point)
+        self._x, self._y = self.spawn_point.x, self.spawn_point.y
         self.rect.topleft = (int(self.spawn_point.x), int(self.spawn_point.y))
         self.direction = Direction.UP
         self.dead = False
@@ -759,10 +966,8 @@ class PlayerTank(Tank):
         shadow_rect.topleft = (shadow_rect.left + 2, shadow_rect.top + 2)
         pygame.draw.rect(surface, PLAYER_SHADOW, shadow_rect)
         if self.invulnerable_timer > 0:
-            glow_radius = self.rect.width + 12
-            glow_surface = pygame.Surface((glow_radius, glow_radius), pygame.SRCALPHA)
             alpha = 90 + int(40 * math.sin(pygame.time.get_ticks() / 140))
-            pygame.draw.circle(glow_surface, (120, 220, 255, alpha), (glow_radius // 2, glow_radius // 2), glow_radius // 2)
+            glow_surface = _player_glow(self.rect.width + 12, alpha)
             surface.blit(glow_surface, glow_surface.get_rect(center=self.rect.center))
         super().draw(surface)
         if self.rapid_fire_timer > 0:
@@ -770,12 +975,7 @@ class PlayerTank(Tank):
             pygame.draw.rect(surface, (255, 210, 120), spark_rect, 2, border_radius=4)
             pygame.draw.rect(surface, (255, 240, 200), spark_rect.inflate(-4, -4), 1, border_radius=3)
         if self.speed_boost_timer > 0:
-            trail_color = (180, 255, 160, 140)
-            for offset in (-8, -4, 0):
-                trail_rect = pygame.Rect(self.rect.left - 6, self.rect.top + 6 + offset, 6, 4)
-                trail_surface = pygame.Surface(trail_rect.size, pygame.SRCALPHA)
-                pygame.draw.rect(trail_surface, trail_color, trail_surface.get_rect(), border_radius=2)
-                surface.blit(trail_surface, trail_rect.topleft)
+            surface.blit(_speed_trail(), (self.rect.left - 6, self.rect.top - 2))
 
 
 class EnemyTank(Tank):
@@ -784,22 +984,18 @@ class EnemyTank(Tank):
         "fast": 150,
         "heavy": 300,
     }
+    # скорость, задержка выстрела, скорость пули, здоровье
+    VARIANT_STATS = {
+        "basic": (84.0, 0.55, 280.0, 1),
+        "fast": (112.0, 0.42, 320.0, 1),
+        "heavy": (72.0, 0.65, 300.0, 2),
+    }
 
     def __init__(self, x: float, y: float, variant: str = "basic"):
-        speed = 84.0
-        fire_delay = 0.55
-        bullet_speed = 280.0
-        if variant == "fast":
-            speed = 112.0
-            fire_delay = 0.42
-            bullet_speed = 320.0
-        elif variant == "heavy":
-            speed = 72.0
-            fire_delay = 0.65
-            bullet_speed = 300.0
+        speed, fire_delay, bullet_speed, health = self.VARIANT_STATS[variant]
         super().__init__(x, y, ENEMY_COLORS[variant], speed, fire_delay, bullet_speed, False)
         self.variant = variant
-        self.health = 2 if variant == "heavy" else 1
+        self.health = health
         self.change_dir_timer = random.uniform(*ENEMY_DIRECTION_DELAY)
         self.fire_timer = random.uniform(*ENEMY_FIRE_DELAY)
         self.score_value = self.SCORE_VALUES[variant]
@@ -810,14 +1006,14 @@ class EnemyTank(Tank):
         self.change_dir_timer -= dt
         moved = False
         if self.change_dir_timer <= 0:
-            self.direction = random.choice(list(Direction))
+            self.direction = random.choice(_ALL_DIRECTIONS)
             self.change_dir_timer = random.uniform(*ENEMY_DIRECTION_DELAY)
         target_list = [enemy for enemy in enemies if enemy is not self]
         if player.active:
             target_list.append(player)
         moved = self.move(self.direction, dt, level, target_list)
         if not moved:
-            self.direction = random.choice(list(Direction))
+            self.direction = random.choice(_ALL_DIRECTIONS)
             self.change_dir_timer = random.uniform(0.4, 1.0)
         self.fire_timer -= dt
         should_fire = False
@@ -849,12 +1045,25 @@ class Game:
         self.score = 0
         self.playfield_background = self._create_playfield_background()
         self.playfield_overlay = self._create_playfield_overlay()
+        # фон, сетка и статичные тайлы уровня одним непрозрачным слоем;
+        # пересобирается целиком на новом уровне и по клеткам при разрушениях
+        self._playfield_base = self.playfield_background.convert()
+        self._playfield_base.blit(self.playfield_overlay, (0, 0))
+        self._playfield = self._playfield_base.copy()
+        self._playfield_level: Optional[Level] = None
         self.panel_background = self._create_panel_background()
-        self.level = Level(parse_level_layout(LEVEL_LAYOUT))
+        # рамка панели постоянна — рисуется один раз прямо на фоне
+        pygame.draw.rect(self.panel_background, PANEL_ACCENT, self.panel_background.get_rect(), 2, border_radius=8)
+        # затемнение поля для меню и экранов конца игры
+        self._dim_overlay = pygame.Surface((PLAY_AREA_WIDTH, PLAY_AREA_HEIGHT), pygame.SRCALPHA)
+        self._dim_overlay.fill((0, 0, 0, 150))
+        self.level = Level(STAGE_LAYOUT)
         self.player = PlayerTank(TILE_SIZE * 12, TILE_SIZE * 23)
         self.player.active = False
         self.enemies: List[EnemyTank] = []
         self.bullets: List[Bullet] = []
+        # пули, уничтоженные за текущий проход update_bullets; из списка убираются разом в конце
+        self._dead_bullets: Set[Bullet] = set()
         self.effects: List[ImpactEffect] = []
         self.bonuses: List[Bonus] = []
         self.remaining_enemies = 0
@@ -862,16 +1071,13 @@ class Game:
         self.game_over_reason: Optional[str] = None
         self.bonus_message: Optional[str] = None
         self.bonus_message_timer = 0.0
+        # прямоугольники движущихся объектов прошлого кадра и то, что меняет весь кадр
+        self._prev_dirty: List[pygame.Rect] = []
+        self._prev_signature: Optional[tuple] = None
+        self._prev_panel: Optional[tuple] = None
 
     def _create_playfield_background(self) -> pygame.Surface:
-        surface = pygame.Surface((PLAY_AREA_WIDTH, PLAY_AREA_HEIGHT))
-        for y in range(PLAY_AREA_HEIGHT):
-            t = y / max(1, PLAY_AREA_HEIGHT - 1)
-            color = tuple(
-                int(BG_COLOR[i] * (1.0 - t) + BG_COLOR_BOTTOM[i] * t) for i in range(3)
-            )
-            pygame.draw.line(surface, color, (0, y), (PLAY_AREA_WIDTH, y))
-        return surface
+        return vertical_gradient((PLAY_AREA_WIDTH, PLAY_AREA_HEIGHT), BG_COLOR, BG_COLOR_BOTTOM)
 
     def _create_playfield_overlay(self) -> pygame.Surface:
         surface = pygame.Surface((PLAY_AREA_WIDTH, PLAY_AREA_HEIGHT), pygame.SRCALPHA)
@@ -883,14 +1089,7 @@ class Game:
         return surface
 
     def _create_panel_background(self) -> pygame.Surface:
-        surface = pygame.Surface((PANEL_WIDTH, SCREEN_HEIGHT))
-        for y in range(SCREEN_HEIGHT):
-            t = y / max(1, SCREEN_HEIGHT - 1)
-            color = tuple(
-                int(PANEL_BG[i] * (1.0 - t) + PANEL_BG_BOTTOM[i] * t) for i in range(3)
-            )
-            pygame.draw.line(surface, color, (0, y), (PANEL_WIDTH, y))
-        return surface
+        return vertical_gradient((PANEL_WIDTH, SCREEN_HEIGHT), PANEL_BG, PANEL_BG_BOTTOM)
 
     def start_new_game(self) -> None:
         self.stage = 1
@@ -904,7 +1103,7 @@ class Game:
         self.prepare_stage(reset_lives=True)
 
     def prepare_stage(self, reset_lives: bool = False) -> None:
-        self.level = Level(parse_level_layout(LEVEL_LAYOUT))
+        self.level = Level(STAGE_LAYOUT)
         self.enemies.clear()
         self.bullets.clear()
         self.effects.clear()
@@ -926,28 +1125,17 @@ class Game:
             return False
         if len(self.enemies) >= MAX_ACTIVE_ENEMIES:
             return False
-        spawn_points = [
-            (TILE_SIZE, TILE_SIZE),
-            (TILE_SIZE * 12, TILE_SIZE),
-            (TILE_SIZE * 23, TILE_SIZE),
-        ]
+        spawn_points = list(ENEMY_SPAWN_POINTS)
         random.shuffle(spawn_points)
-        variants = ["basic", "fast", "heavy"]
+        obstacle_rects = [self.player.rect] if self.player.active else []
+        obstacle_rects.extend(enemy.rect for enemy in self.enemies)
         for spawn in spawn_points:
             rect = pygame.Rect(spawn[0], spawn[1], TILE_SIZE, TILE_SIZE)
-            if self.level.is_rect_blocked(rect):
-                continue
-            blocked = False
-            if self.player.active and rect.colliderect(self.player.rect):
-                blocked = True
-            if not blocked:
-                for enemy in self.enemies:
-                    if rect.colliderect(enemy.rect):
-                        blocked = True
-                        break
-            if blocked:
+            if self.level.is_rect_blocked(rect) or rect.collidelist(obstacle_rects) != -1:
                 continue
-            variant = random.choices(variants, weights=[0.6, 0.25, 0.15], k=1)[0]
+            # 60% обычных, 25% быстрых, 15% тяжёлых — одно random() вместо choices
+            roll = random.random()
+            variant = "basic" if roll < 0.6 else ("fast" if roll < 0.85 else "heavy")
             enemy = EnemyTank(spawn[0], spawn[1], variant)
             self.enemies.append(enemy)
             self.remaining_enemies -= 1
@@ -972,17 +1160,10 @@ class Game:
 
     def handle_player_input(self, dt: float) -> None:
         keys = pygame.key.get_pressed()
-        direction: Optional[Direction] = None
-        if keys[pygame.K_UP]:
-            direction = Direction.UP
-        elif keys[pygame.K_DOWN]:
-            direction = Direction.DOWN
-        elif keys[pygame.K_LEFT]:
-            direction = Direction.LEFT
-        elif keys[pygame.K_RIGHT]:
-            direction = Direction.RIGHT
-        if direction is not None:
-            self.player.move(direction, dt, self.level, self.enemies)
+        for key, direction in PLAYER_MOVE_KEYS:
+            if keys[key]:
+                self.player.move(direction, dt, self.level, self.enemies)
+                break
         if keys[pygame.K_SPACE]:
             bullet = self.player.fire()
             if bullet is not None:
@@ -990,38 +1171,43 @@ class Game:
                 self.on_bullet_fired(bullet)
 
     def update_bullets(self, dt: float) -> None:
-        play_rect = pygame.Rect(0, 0, PLAY_AREA_WIDTH, PLAY_AREA_HEIGHT)
-        for bullet in list(self.bullets):
+        dead = self._dead_bullets
+        # горячий цикл: атрибуты, не меняющиеся за проход, связаны с локальными именами
+        remove_bullet = self.remove_bullet
+        handle_collision = self.level.handle_bullet_collision
+        player = self.player
+        # уязвимые враги и их прямоугольники собираются один раз; попадание ищет collidelist
+        targets = [enemy for enemy in self.enemies if enemy.invulnerable_timer <= 0]
+        target_rects = [enemy.rect for enemy in targets]
+        for bullet in self.bullets:
             bullet.update(dt)
-            if not play_rect.contains(bullet.rect):
-                self.remove_bullet(bullet)
+            rect = bullet.rect
+            if rect.x < 0 or rect.y < 0 or rect.right > PLAY_AREA_WIDTH or rect.bottom > PLAY_AREA_HEIGHT:
+                remove_bullet(bullet)
                 continue
-            collision = self.level.handle_bullet_collision(bullet.rect)
+            collision = handle_collision(rect)
             if collision is not None:
-                self.remove_bullet(bullet)
+                remove_bullet(bullet)
                 if collision == "brick":
                     self.sound_manager.play("brick")
-                    self.add_effect(bullet.rect.center, (255, 170, 120), radius=18.0)
+                    self.add_effect(rect.center, (255, 170, 120), radius=18.0)
                 elif collision == "block":
                     self.sound_manager.play("impact")
-                    self.add_effect(bullet.rect.center, (180, 200, 220), radius=14.0)
+                    self.add_effect(rect.center, (180, 200, 220), radius=14.0)
                 elif collision == "base" and self.state == "playing":
                     self.sound_manager.play("explosion")
-                    self.add_effect(bullet.rect.center, (255, 120, 120), radius=26.0)
+                    self.add_effect(rect.center, (255, 120, 120), radius=26.0)
                     self.state = "game_over"
                     self.game_over_reason = "base"
                 continue
             if bullet.friendly:
-                target_hit = None
-                for enemy in self.enemies:
-                    if enemy.invulnerable_timer > 0:
-                        continue
-                    if bullet.rect.colliderect(enemy.rect):
-                        target_hit = enemy
-                        break
-                if target_hit is not None:
+                index = rect.collidelist(target_rects)
+                if index != -1:
+                    target_hit = targets[index]
                     if target_hit.take_damage():
                         self.enemies.remove(target_hit)
+                        del targets[index]
+                        del target_rects[index]
                         self.score += target_hit.score_value
                         self.sound_manager.play("explosion")
                         self.add_effect(target_hit.rect.center, (255, 200, 120), radius=28.0)
@@ -1029,43 +1215,47 @@ class Game:
                     else:
                         self.sound_manager.play("impact")
                         self.add_effect(target_hit.rect.center, (255, 200, 120), radius=18.0)
-                    self.remove_bullet(bullet)
+                    remove_bullet(bullet)
                     continue
             else:
-                if self.player.active and self.player.invulnerable_timer <= 0 and bullet.rect.colliderect(self.player.rect):
+                if player.active and player.invulnerable_timer <= 0 and rect.colliderect(player.rect):
                     self.sound_manager.play("explosion")
-                    self.add_effect(self.player.rect.center, (255, 140, 120), radius=28.0)
-                    self.remove_bullet(bullet)
+                    self.add_effect(player.rect.center, (255, 140, 120), radius=28.0)
+                    remove_bullet(bullet)
                     self.on_player_hit()
                     continue
             # проверка столкновений пуль между собой
-        to_remove: List[Bullet] = []
+        # свои пули против чужих: внутренний цикл уходит в collidelistall (C)
+        friendly = [b for b in self.bullets if b.friendly and b not in dead]
+        hostile = [b for b in self.bullets if not b.friendly and b not in dead]
+        to_remove: Set[Bullet] = set()
         collision_points: List[Tuple[float, float]] = []
-        for i, bullet_a in enumerate(self.bullets):
-            for bullet_b in self.bullets[i + 1 :]:
-                if bullet_a.friendly == bullet_b.friendly:
+        if friendly and hostile:
+            hostile_rects = [b.rect for b in hostile]
+            for bullet_a in friendly:
+                hits = bullet_a.rect.collidelistall(hostile_rects)
+                if not hits:
                     continue
-                if bullet_a.rect.colliderect(bullet_b.rect):
-                    if bullet_a not in to_remove:
-                        to_remove.append(bullet_a)
-                    if bullet_b not in to_remove:
-                        to_remove.append(bullet_b)
-                    collision_points.append(
-                        (
-                            (bullet_a.rect.centerx + bullet_b.rect.centerx) / 2,
-                            (bullet_a.rect.centery + bullet_b.rect.centery) / 2,
-                        )
-                    )
+                to_remove.add(bullet_a)
+                ax, ay = bullet_a.rect.center
+                for index in hits:
+                    bullet_b = hostile[index]
+                    to_remove.add(bullet_b)
+                    bx, by = hostile_rects[index].center
+                    collision_points.append(((ax + bx) / 2, (ay + by) / 2))
         if collision_points:
             self.sound_manager.play("ricochet")
         for bullet in to_remove:
             self.remove_bullet(bullet)
         for point in collision_points:
             self.add_effect(point, (255, 240, 200), radius=16.0, duration=0.28, thickness=2)
+        if dead:
+            self.bullets[:] = [b for b in self.bullets if b not in dead]
+            dead.clear()
 
     def remove_bullet(self, bullet: Bullet) -> None:
-        if bullet in self.bullets:
-            self.bullets.remove(bullet)
+        if bullet not in self._dead_bullets:
+            self._dead_bullets.add(bullet)
             bullet.owner.on_bullet_destroyed()
 
     def add_effect(
@@ -1079,10 +1269,11 @@ class Game:
         self.effects.append(ImpactEffect(position, color, radius, duration, thickness))
 
     def update_effects(self, dt: float) -> None:
-        for effect in list(self.effects):
+        effects = self.effects
+        for effect in effects:
             effect.update(dt)
-            if effect.finished:
-                self.effects.remove(effect)
+        # отработавшие эффекты убираются одним проходом, без list.remove
+        effects[:] = [effect for effect in effects if not effect.finished]
 
     def on_bullet_fired(self, bullet: Bullet) -> None:
         color = (255, 220, 140) if bullet.friendly else (255, 140, 110)
@@ -1107,19 +1298,23 @@ class Game:
         self.add_effect((spawn_x, spawn_y), definition.color, radius=24.0, duration=0.45, thickness=4)
 
     def update_bonuses(self, dt: float) -> None:
-        for bonus in list(self.bonuses):
+        remaining: List[Bonus] = []
+        # бонусы неподвижны: все касания игрока находятся заранее одним collidelistall
+        picked = set(self.player.rect.collidelistall([bonus.rect for bonus in self.bonuses])) if self.player.active else set()
+        for index, bonus in enumerate(self.bonuses):
             bonus.update(dt)
             if bonus.expired:
-                self.bonuses.remove(bonus)
                 continue
-            if self.player.active and self.player.rect.colliderect(bonus.rect):
+            if index in picked:
                 message = self.player.apply_bonus(bonus.type)
-                self.bonuses.remove(bonus)
                 self.sound_manager.play("bonus_pick")
                 definition = BONUS_DEFINITIONS[bonus.type]
                 self.add_effect(bonus.rect.center, definition.color, radius=26.0, duration=0.4, thickness=4)
                 if message:
                     self.show_bonus_message(message)
+                continue
+            remaining.append(bonus)
+        self.bonuses[:] = remaining
 
     def show_bonus_message(self, text: str) -> None:
         self.bonus_message = text
@@ -1150,7 +1345,7 @@ class Game:
             self.player.update_respawn(dt, self.level, self.enemies)
         else:
             self.handle_player_input(dt)
-        for enemy in list(self.enemies):
+        for enemy in self.enemies:
             bullet = enemy.update_ai(dt, self.level, self.player, self.enemies)
             if bullet is not None:
                 self.bullets.append(bullet)
@@ -1172,7 +1367,6 @@ class Game:
     def draw_panel(self) -> None:
         panel_rect = pygame.Rect(PLAY_AREA_WIDTH, 0, PANEL_WIDTH, SCREEN_HEIGHT)
         self.screen.blit(self.panel_background, panel_rect)
-        pygame.draw.rect(self.screen, PANEL_ACCENT, panel_rect, 2, border_radius=8)
         lines = [
             f"Этап: {self.stage}",
             f"Очки: {self.score}",
@@ -1181,96 +1375,160 @@ class Game:
         ]
         text_y = 24
         for line in lines:
-            text = self.font_medium.render(line, True, PANEL_TEXT)
+            text = render_text(line, self.font_medium, PANEL_TEXT)
             self.screen.blit(text, (PLAY_AREA_WIDTH + 16, text_y))
             text_y += 36
         status_y = text_y + 12
-        if self.player.invulnerable_timer > 0:
-            shield_progress = min(1.0, self.player.invulnerable_timer / 8.0)
-            status_y = self._draw_status_bar("Щит", shield_progress, status_y, (120, 210, 255))
-        if self.player.rapid_fire_timer > 0:
-            progress = self.player.rapid_fire_timer / self.player.rapid_fire_duration if self.player.rapid_fire_duration > 0 else 0
-            status_y = self._draw_status_bar("Скорострельность", progress, status_y, (255, 210, 130))
-        if self.player.speed_boost_timer > 0:
-            progress = self.player.speed_boost_timer / self.player.speed_boost_duration if self.player.speed_boost_duration > 0 else 0
-            status_y = self._draw_status_bar("Скорость", progress, status_y, (170, 220, 130))
+        for label, progress, color in self._status_bars():
+            status_y = self._draw_status_bar(label, progress, status_y, color)
         if self.state == "menu":
-            hint_lines = [
-                "Стрелки — движение",
-                "Пробел — огонь",
-                "Enter — начать",
-            ]
-            for i, line in enumerate(hint_lines):
-                text = self.font_small.render(line, True, (180, 180, 200))
+            for i, line in enumerate(MENU_HINT_LINES):
+                text = render_text(line, self.font_small, (180, 180, 200))
                 self.screen.blit(text, (PLAY_AREA_WIDTH + 16, 200 + i * 26))
         else:
-            text = self.font_small.render("ESC — выход", True, (160, 160, 180))
+            text = render_text("ESC — выход", self.font_small, (160, 160, 180))
             self.screen.blit(text, (PLAY_AREA_WIDTH + 16, SCREEN_HEIGHT - 40))
         if self.bonus_message:
-            message_surface = self.font_small.render(self.bonus_message, True, PANEL_ACCENT)
+            message_surface = render_text(self.bonus_message, self.font_small, PANEL_ACCENT)
             self.screen.blit(message_surface, (PLAY_AREA_WIDTH + 16, SCREEN_HEIGHT - 72))
 
+    def _status_bars(self) -> List[Tuple[str, float, Tuple[int, int, int]]]:
+        bars: List[Tuple[str, float, Tuple[int, int, int]]] = []
+        player = self.player
+        if player.invulnerable_timer > 0:
+            bars.append(("Щит", min(1.0, player.invulnerable_timer / 8.0), (120, 210, 255)))
+        if player.rapid_fire_timer > 0:
+            progress = player.rapid_fire_timer / player.rapid_fire_duration if player.rapid_fire_duration > 0 else 0
+            bars.append(("Скорострельность", progress, (255, 210, 130)))
+        if player.speed_boost_timer > 0:
+            progress = player.speed_boost_timer / player.speed_boost_duration if player.speed_boost_duration > 0 else 0
+            bars.append(("Скорость", progress, (170, 220, 130)))
+        return bars
+
     def _draw_status_bar(self, label: str, progress: float, y: int, color: Tuple[int, int, int]) -> int:
-        text = self.font_small.render(label, True, PANEL_TEXT)
+        text = render_text(label, self.font_small, PANEL_TEXT)
         self.screen.blit(text, (PLAY_AREA_WIDTH + 16, y))
-        bar_rect = pygame.Rect(PLAY_AREA_WIDTH + 16, y + 18, PANEL_WIDTH - 32, 10)
-        pygame.draw.rect(self.screen, (34, 40, 56), bar_rect, border_radius=4)
-        inner = bar_rect.inflate(-2, -2)
-        inner.width = int(inner.width * max(0.0, min(1.0, progress)))
-        pygame.draw.rect(self.screen, color, inner, border_radius=4)
+        x = PLAY_AREA_WIDTH + 16
+        pygame.draw.rect(self.screen, (34, 40, 56), (x, y + 18, STATUS_BAR_WIDTH, 10), border_radius=4)
+        # заливка — на пиксель внутри рамки полосы
+        fill_width = int((STATUS_BAR_WIDTH - 2) * max(0.0, min(1.0, progress)))
+        pygame.draw.rect(self.screen, color, (x + 1, y + 19, fill_width, 8), border_radius=4)
         return y + 32
 
     def draw_state_overlay(self) -> None:
         if self.state == "playing":
             return
-        overlay = pygame.Surface((PLAY_AREA_WIDTH, PLAY_AREA_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 150))
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self._dim_overlay, (0, 0))
         if self.state == "menu":
-            title = self.font_large.render("Танчики", True, (255, 220, 120))
-            subtitle = self.font_medium.render("Нажмите Enter для начала", True, (240, 240, 240))
+            title = render_text("Танчики", self.font_large, (255, 220, 120))
+            subtitle = render_text("Нажмите Enter для начала", self.font_medium, (240, 240, 240))
             self.screen.blit(title, title.get_rect(center=(PLAY_AREA_WIDTH // 2, PLAY_AREA_HEIGHT // 2 - 40)))
             self.screen.blit(subtitle, subtitle.get_rect(center=(PLAY_AREA_WIDTH // 2, PLAY_AREA_HEIGHT // 2 + 20)))
         elif self.state == "game_over":
-            title = self.font_large.render("Поражение", True, (255, 100, 100))
+            title = render_text("Поражение", self.font_large, (255, 100, 100))
             reason = "База уничтожена" if self.game_over_reason == "base" else "Танк разбит"
-            subtitle = self.font_medium.render(reason, True, (240, 240, 240))
-            hint = self.font_small.render("Enter — сыграть ещё", True, (220, 220, 220))
+            subtitle = render_text(reason, self.font_medium, (240, 240, 240))
+            hint = render_text("Enter — сыграть ещё", self.font_small, (220, 220, 220))
             self.screen.blit(title, title.get_rect(center=(PLAY_AREA_WIDTH // 2, PLAY_AREA_HEIGHT // 2 - 40)))
             self.screen.blit(subtitle, subtitle.get_rect(center=(PLAY_AREA_WIDTH // 2, PLAY_AREA_HEIGHT // 2 + 10)))
             self.screen.blit(hint, hint.get_rect(center=(PLAY_AREA_WIDTH // 2, PLAY_AREA_HEIGHT // 2 + 50)))
         elif self.state == "victory":
-            title = self.font_large.render("Победа!", True, (130, 220, 130))
-            subtitle = self.font_medium.render("Нажмите Enter — следующий этап", True, (240, 240, 240))
+            title = render_text("Победа!", self.font_large, (130, 220, 130))
+            subtitle = render_text("Нажмите Enter — следующий этап", self.font_medium, (240, 240, 240))
             self.screen.blit(title, title.get_rect(center=(PLAY_AREA_WIDTH // 2, PLAY_AREA_HEIGHT // 2 - 40)))
             self.screen.blit(subtitle, subtitle.get_rect(center=(PLAY_AREA_WIDTH // 2, PLAY_AREA_HEIGHT // 2 + 20)))
 
-    def draw(self) -> None:
-        self.screen.blit(self.playfield_background, (0, 0))
+    def draw(self) -> Optional[List[pygame.Rect]]:
+        """Рисует кадр; возвращает изменившиеся прямоугольники или None, если нужен flip."""
+        self._refresh_playfield()
+        self.screen.blit(self._playfield, (0, 0))
         play_surface = self.screen.subsurface(pygame.Rect(0, 0, PLAY_AREA_WIDTH, PLAY_AREA_HEIGHT))
-        play_surface.blit(self.playfield_overlay, (0, 0))
-        self.level.draw(play_surface)
         for bonus in self.bonuses:
             bonus.draw(play_surface)
-        for bullet in self.bullets:
-            bullet.draw(play_surface)
+        # пули и враги — готовые спрайты, каждая группа уходит одним вызовом blits;
+        # игрок рисуется отдельно из-за свечения и следов бонусов
+        play_surface.blits([bullet.blit_item() for bullet in self.bullets], doreturn=False)
         if self.player.active:
             self.player.draw(play_surface)
-        for enemy in self.enemies:
-            enemy.draw(play_surface)
+        play_surface.blits([enemy.blit_item() for enemy in self.enemies], doreturn=False)
         self.level.draw_overlay(play_surface)
         for effect in self.effects:
             effect.draw(play_surface)
         self.draw_panel()
         self.draw_state_overlay()
+        return self._collect_dirty()
+
+    def _refresh_playfield(self) -> None:
+        level = self.level
+        if level is not self._playfield_level:
+            self._playfield_level = level
+            self._playfield.blit(self._playfield_base, (0, 0))
+            level.draw(self._playfield)
+            return
+        for rect in level.dirty_rects:
+            self._playfield.blit(self._playfield_base, rect, rect)
+            level.draw(self._playfield, rect)
+
+    def _panel_signature(self) -> tuple:
+        bar_width = STATUS_BAR_WIDTH - 2
+        return (
+            self.stage,
+            self.score,
+            self.player.lives,
+            self.remaining_enemies + len(self.enemies),
+            self.bonus_message,
+            tuple((label, int(bar_width * max(0.0, min(1.0, progress)))) for label, progress, _ in self._status_bars()),
+        )
+
+    def _moving_rects(self) -> List[pygame.Rect]:
+        # с запасом на свечение, ствол и следы — как у спрайтов в draw
+        pad = Tank.SPRITE_PAD * 2
+        rects = [bullet.rect.inflate(6, 6) for bullet in self.bullets]
+        rects.extend(enemy.rect.inflate(pad, pad) for enemy in self.enemies)
+        if self.player.active:
+            rects.append(self.player.rect.inflate(pad, pad))
+        rects.extend(bonus.rect.inflate(24, 24) for bonus in self.bonuses)
+        for effect in self.effects:
+            size = int(effect.radius) * 2 + 2
+            rect = pygame.Rect(0, 0, size, size)
+            rect.center = (int(effect.position.x), int(effect.position.y))
+            rects.append(rect)
+        return rects
+
+    def _collect_dirty(self) -> Optional[List[pygame.Rect]]:
+        level_rects = self.level.dirty_rects[:]
+        self.level.dirty_rects.clear()
+        current = self._moving_rects()
+        previous = self._prev_dirty
+        self._prev_dirty = current
+        signature = (self.state, self.level)
+        full = signature != self._prev_signature or self.state != "playing"
+        self._prev_signature = signature
+        if full:
+            self._prev_panel = self._panel_signature()
+            return None
+        dirty = previous + current + level_rects
+        panel = self._panel_signature()
+        if panel != self._prev_panel:
+            self._prev_panel = panel
+            dirty.append(pygame.Rect(PLAY_AREA_WIDTH, 0, PANEL_WIDTH, SCREEN_HEIGHT))
+        if sum(rect.width * rect.height for rect in dirty) > SCREEN_WIDTH * SCREEN_HEIGHT // 4:
+            return None
+        return dirty
 
     def run(self) -> None:
+        accumulator = 0.0
         while self.running:
-            dt = self.clock.tick(FPS) / 1000.0
+            accumulator += min(self.clock.tick(FPS) / 1000.0, MAX_FRAME_TIME)
             self.handle_events()
-            self.update(dt)
-            self.draw()
-            pygame.display.flip()
+            while accumulator >= FIXED_STEP:
+                self.update(FIXED_STEP)
+                accumulator -= FIXED_STEP
+            dirty = self.draw()
+            if dirty is None:
+                pygame.display.flip()
+            else:
+                pygame.display.update(dirty)
         pygame.quit()
 
 